@@ -22,28 +22,40 @@
 
 import time
 import argparse
-import ast
 import datetime
+import functools
+import json
 import logging
 import os
 import pprint
-from getpass import getpass
-from solidfire.factory import ElementFactory
-from solidfire import common
-from solidfire.common import LOG
-from solidfire.common import ApiServerError
-from solidfire.common import SdkOperationError
-common.setLogLevel(logging.ERROR)
+import random
+import re
+import socket
+import stat
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+class LonghornyError(SystemExit):
+    """
+    Raised instead of calling exit() when an action fails. The details are logged before it is raised.
+
+    It is a SystemExit, so the CLI exits with the same status code (1-4, 100, 200, 300) as before.
+    """
 
 
 def cluster(args):
     if args.list:
+        connect_sites(src, dst, args.no_cache)
         pairing = report_cluster_pairing(src, dst)
         print("\nCLUSTER (MUTUAL) PAIRING REPORT:\n")
-        pprint.pp(pairing)
+        print_report(pairing)
     elif args.pair:
+        connect_sites(src, dst, args.no_cache)
         pair_cluster(src, dst)
     elif args.unpair:
+        connect_sites(src, dst, args.no_cache)
         unpair_cluster(src, dst)
     else:
         logging.warning(
@@ -59,79 +71,82 @@ def report_cluster_pairing(src: dict, dst: dict) -> dict:
     if len(pairing[src['clusterName']]) == 0 and len(
             pairing[dst['clusterName']]) == 0:
         print("Neither cluster has existing cluster pairing relationship(s).")
-        logging.warning("Neither " +
-                        str(src['clusterName']) +
-                        " nor " +
-                        str(dst['clusterName']) +
-                        " has any cluster pairing relationships.")
+        logging.warning("Neither %s nor %s has any cluster pairing relationships.",
+                        src['clusterName'], dst['clusterName'])
     elif len(pairing[src['clusterName']]) == 0 or len(pairing[dst['clusterName']]) == 0:
-        logging.warning("One of the clusters is not paired. Number of relationships (SRC/DST): " +
-                        str(len(pairing[src['clusterName']])) + "/" + str(len(pairing[dst['clusterName']])) + ".")
+        logging.warning("One of the clusters is not paired. Number of relationships (SRC/DST): %s/%s.",
+                        len(pairing[src['clusterName']]), len(pairing[dst['clusterName']]))
     else:
-        for site in pairing:
-            for i in pairing[site]:
-                if i['clusterPairUUID'] in [j['clusterPairUUID']
-                                            for j in pairing[site]]:
-                    logging.info(
-                        "Clusters are paired through clusterPairUUID " + str(i['clusterPairUUID']) + ".")
-                else:
-                    logging.warning(
-                        "Clusters have pairing relationships but are not mutually paired. Foreign relationship: " +
-                        str(
-                            i['clusterPairUUID']) +
-                        ".")
+        compare_cluster_pairs(src, dst, pairing)
     return (pairing)
 
 
-def get_cluster_pairing(src: dict, dst: dict) -> dict:
+def get_cluster_pairing(src: dict, dst: dict, refresh: bool = False) -> dict:
     """
     Return dict with per-site cluster pairings on both clusters.
 
     May return several or no pairing relationships for each cluster, including with other clusters.
+    The result is cached for the rest of the run. Use refresh=True after actions that change cluster pairing.
     """
+    cache_key = (id(src['sfe']), id(dst['sfe']))
+    if not refresh and cache_key in pairing_cache:
+        logging.info("Using cached cluster pairing information.")
+        return pairing_cache[cache_key]
     pairing = {}
-    for site in src, dst:
-        logging.info("Querying site: " + str(site['mvip']) + ".")
-        try:
-            r = site['sfe'].list_cluster_pairs().to_json()['clusterPairs']
-            logging.info(
-                "Result for site: " +
-                site['mvip'] +
-                " : ",
-                str(r) +
-                ".")
-            pairing[site['clusterName']] = r
-        except common.ApiServerError as e:
-            logging.error(
-                "Error listing cluster pairs for cluster: " + str(site['clusterName']) + ".")
-            logging.error("Error: " + str(e))
-            exit(100)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [(site, executor.submit(
+            retry_api_call, site['sfe'].list_cluster_pairs))
+            for site in (src, dst)]
+        for site, future in futures:
+            logging.info("Querying site: %s.", site['mvip'])
+            try:
+                r = future.result().to_json()['clusterPairs']
+                logging.info("Result for site: %s : %s.", site['mvip'], r)
+                pairing[site['clusterName']] = r
+            except common.ApiServerError as e:
+                logging.error(
+                    "Error listing cluster pairs for cluster: %s.", site['clusterName'])
+                logging.error("Error: %s", e)
+                raise LonghornyError(100)
+    pairing_cache[cache_key] = pairing
     return pairing
 
 
-def get_exclusive_cluster_pairing(src: dict, dst: dict) -> dict:
+def compare_cluster_pairs(src: dict, dst: dict, pairing: dict) -> tuple:
+    """
+    Return sets of mutual and foreign clusterPairUUIDs in cluster pairing information from get_cluster_pairing.
+
+    Mutual relationships exist on both SRC and DST. Foreign relationships exist on only one of them, i.e. with some other cluster.
+    """
+    src_uuids = {i['clusterPairUUID'] for i in pairing[src['clusterName']]}
+    dst_uuids = {i['clusterPairUUID'] for i in pairing[dst['clusterName']]}
+    mutual = src_uuids & dst_uuids
+    foreign = (src_uuids | dst_uuids) - mutual
+    for uuid in mutual:
+        logging.info("Clusters are paired through clusterPairUUID %s.", uuid)
+    for uuid in foreign:
+        logging.warning(
+            "Clusters have pairing relationships but are not mutually paired. Foreign relationship: %s.", uuid)
+    return mutual, foreign
+
+
+def get_exclusive_cluster_pairing(
+        src: dict, dst: dict, refresh: bool = False) -> dict:
     """
     Return dict with 1-to-1 pairing relationships between SRC and DST clusters if and only if that one cluster paring relationship exists.
     """
-    pairing = get_cluster_pairing(src, dst)
+    pairing = get_cluster_pairing(src, dst, refresh=refresh)
     if not len(pairing[src['clusterName']]) == 1 and not len(
             pairing[dst['clusterName']]) == 1:
-        logging.warning("Number of cluster pair relationships (SRC/DST): " +
-                        str(len(pairing[src['clusterName']])) + "/" + str(len(pairing[dst['clusterName']])) + ".")
+        logging.warning("Number of cluster pair relationships (SRC/DST): %s/%s.",
+                        len(pairing[src['clusterName']]), len(pairing[dst['clusterName']]))
         return {}
     else:
-        for site in pairing:
-            for i in pairing[site]:
-                if i['clusterPairUUID'] in [j['clusterPairUUID']
-                                            for j in pairing[site]]:
-                    logging.info(
-                        "Clusters are paired through clusterPairUUID " + str(i['clusterPairUUID']) + ".")
-                else:
-                    logging.warning(
-                        "Clusters have pairing relationships but are not mutually paired. Foreign relationship: " +
-                        str(
-                            i['clusterPairUUID']) +
-                        ".")
+        mutual, foreign = compare_cluster_pairs(src, dst, pairing)
+        if len(mutual) != 1 or foreign:
+            logging.warning("Clusters are not exclusively paired. Mutual/foreign relationships: %s/%s.",
+                            len(mutual), len(foreign))
+            return {}
         return pairing
 
 
@@ -144,26 +159,24 @@ def pair_cluster(src: dict, dst: dict):
     pairing = get_cluster_pairing(src, dst)
     if pairing[src['clusterName']] == [] and pairing[dst['clusterName']] == []:
         try:
-            pairing_key = src['sfe'].start_cluster_pairing().to_json()[
-                'clusterPairingKey']
-            resp = dst['sfe'].complete_cluster_pairing(pairing_key).to_json()
-            if isinstance(resp['clusterPairID'], int):
-                logging.info("Pairing is now complete. Cluster " +
-                             src['clusterName'] +
-                             "returned cluster pair ID " +
-                             str(resp['clusterPairID']) +
-                             ".")
+            pairing_key = src['sfe'].start_cluster_pairing(
+            ).cluster_pairing_key
+            resp = dst['sfe'].complete_cluster_pairing(pairing_key)
+            if isinstance(resp.cluster_pair_id, int):
+                logging.info("Pairing is now complete. Cluster %sreturned cluster pair ID %s.",
+                             src['clusterName'], resp.cluster_pair_id)
         except common.ApiServerError as e:
-            logging.error("Error: Unable to pair clusters: " + str(e))
-            exit(100)
-        exclusive_pairing = get_exclusive_cluster_pairing(src, dst)
+            logging.error("Error: Unable to pair clusters: %s", e)
+            raise LonghornyError(100)
+        exclusive_pairing = get_exclusive_cluster_pairing(
+            src, dst, refresh=True)
         print("\nCLUSTER PAIRING STATUS AFTER PAIRING:\n")
-        pprint.pp(exclusive_pairing)
+        print_report(exclusive_pairing)
         return
     else:
         logging.warning(
             "Clusters are already paired, paired with more than one cluster or in an incomplete pairing state. Use cluster --list to view current status. Exiting.")
-        exit(100)
+        raise LonghornyError(100)
 
 
 def unpair_cluster(src: dict, dst: dict):
@@ -176,153 +189,156 @@ def unpair_cluster(src: dict, dst: dict):
     if pairing == {}:
         logging.error(
             "Clusters are not paired, in an incomplete pairing state or there is some other problem. Use cluster --list to view current status.")
-        exit(100)
+        raise LonghornyError(100)
     cluster_pair_ids = []
     for site in src, dst:
-        try:
-            resp = site['sfe'].list_cluster_pairs().to_json()['clusterPairs']
-            cluster_pair_ids.append(
-                (site['clusterName'], resp[0]['clusterPairID']))
-        except common.ApiServerError as e:
-            logging.error("Error: Unable to list cluster pairs: " + str(e))
-            logging.error("Error: " + str(e))
-            exit(100)
-    volume_relationships_check = list_volume(src, dst, [])
-    if len(volume_relationships_check) > 0 or volume_relationships_check != []:
+        resp = pairing[site['clusterName']]
+        cluster_pair_ids.append(
+            (site['clusterName'], resp[0]['clusterPairID']))
+    # One paired volume on either site is enough to refuse unpairing, so
+    # there is no need to list and validate all of them
+    paired_params = {**PAIRED_VOLUMES, 'limit': 1}
+    src_paired, dst_paired = run_on_both_sites(
+        lambda: retry_api_call(src['sfe'].invoke_sfapi,
+                               method='ListVolumes', parameters=paired_params),
+        lambda: retry_api_call(dst['sfe'].invoke_sfapi,
+                               method='ListVolumes', parameters=paired_params))
+    if src_paired['volumes'] != [] or dst_paired['volumes'] != []:
         logging.error(
             "One or both clusters are already have paired volumes. Please unpair all paired volumes first.")
-        exit(100)
+        raise LonghornyError(100)
     if len(resp) == 0 or len(resp) > 1:
         logging.error(
             "Zero or more than one cluster pairs found. Cluster unpairing action requires a 1-to-1 mutual and exclusive relationship. Exiting.")
-        exit(100)
+        raise LonghornyError(100)
     else:
         for site_id_tuple in cluster_pair_ids:
             if site_id_tuple[0] == src['clusterName']:
                 site = src
                 try:
-                    resp = site['sfe'].remove_cluster_pair(
-                        site_id_tuple[1]).to_json()
+                    site['sfe'].remove_cluster_pair(site_id_tuple[1])
                 except common.ApiServerError as e:
-                    logging.error(
-                        "Error: Unable to unpair clusters: " + str(e))
-                    exit(100)
+                    logging.error("Error: Unable to unpair clusters: %s", e)
+                    raise LonghornyError(100)
             else:
                 site = dst
                 try:
-                    resp = site['sfe'].remove_cluster_pair(
-                        site_id_tuple[1]).to_json()
+                    site['sfe'].remove_cluster_pair(site_id_tuple[1])
                 except common.ApiServerError as e:
-                    logging.error(
-                        "Error: Unable to unpair clusters: " + str(e))
-                    exit(100)
-    exclusive_pairing = get_exclusive_cluster_pairing(src, dst)
+                    logging.error("Error: Unable to unpair clusters: %s", e)
+                    raise LonghornyError(100)
+    exclusive_pairing = get_exclusive_cluster_pairing(src, dst, refresh=True)
     print("\nCLUSTER PAIRING STATUS AFTER UNPAIRING:\n")
-    pprint.pp(exclusive_pairing)
+    print_report(exclusive_pairing)
     return
 
 
 def volume(args):
     if args.list:
         try:
-            try:
+            if args.data:
                 volume_pair = data_type(args.data)
                 logging.info(
-                    "Data provided for listing volumes. Querying pair: " +
-                    str(volume_pair) +
-                    " for pairing status.")
-            except BaseException:
+                    "Data provided for listing volumes. Querying pair: %s for pairing status.", volume_pair)
+            else:
                 volume_pair = []
             logging.info(
-                "Trying to list volumes in list " +
-                str(volume_pair) +
-                " for pairing status.")
+                "Trying to list volumes in list %s for pairing status.", volume_pair)
+            connect_sites(src, dst, args.no_cache)
             list_volume(src, dst, volume_pair)
         except Exception as e:
-            logging.error("Error: " + str(e))
-            exit(200)
+            logging.error("Error: %s", e)
+            raise LonghornyError(200)
     elif args.report:
         try:
-            if args.data is None or args.data == '':
+            if not args.data:
                 logging.error(
                     "No data provided for volume report customization. Using default value: [].")
                 report_data = {}
             else:
                 report_data = {}
                 pass
+            connect_sites(src, dst, args.no_cache)
             report_volume_replication_status(src, dst, report_data)
         except Exception as e:
-            logging.error("Error: " + str(e))
-            exit(200)
+            logging.error("Error: %s", e)
+            raise LonghornyError(200)
     elif args.pair:
         pair_data = data_type(args.data)
+        connect_sites(src, dst, args.no_cache)
         pair_volume(src, dst, pair_data)
     elif args.unpair:
         try:
             data = data_type(args.data)
-        except BaseException:
+        except (ValueError, IndexError, AttributeError):
             logging.error(
                 "Error: Unpair data missing or not understood. Presently only one pair is supported per unpair action, ex: --data '1,2'. Exiting.")
-            exit(200)
-        if data is None or data == []:
+            raise LonghornyError(200)
+        if not data:
             logging.error(
                 "No data found for unpairing. By default, unpair action unpairs nothing rather than everything. Exiting.")
-            exit(200)
+            raise LonghornyError(200)
+        connect_sites(src, dst, args.no_cache)
         unpair_volume(src, dst, data)
     elif args.prime_dst:
         av_data = account_volume_data(args.data)
+        connect_sites(src, dst, args.no_cache)
         prime_destination_volumes(src, dst, av_data)
     elif args.reverse:
+        connect_sites(src, dst, args.no_cache)
         reverse_replication(src, dst)
     elif args.snapshot:
-        if args.data is None or args.data == '':
+        if not args.data:
             logging.info(
                 "No data input provided. Using default values: 168,long168h-snap.")
             data = '168;long168h-snap'
         else:
             data = args.data
         snap_data = snapshot_data(data)
+        connect_sites(src, dst, args.no_cache)
         snapshot_site(src, dst, snap_data)
     elif args.mismatched:
+        connect_sites(src, dst, args.no_cache)
         list_mismatched_pairs(src, dst)
     elif args.set_mode:
         if args.data is None:
             logging.error(
                 "Replication takes two inputs; the mode and one or more volume IDs from the replication source (e.g. --data 'Async;100,101)'. Exiting.")
-            exit(200)
+            raise LonghornyError(200)
         else:
             volume_mode = replication_data(args.data)
-            logging.info("Desired replication type: " +
-                         str(volume_mode[0]) +
-                         " for volume ID(s)" +
-                         str(volume_mode[1]) +
-                         ".")
+            logging.info("Desired replication type: %s for volume ID(s)%s.",
+                         volume_mode[0], volume_mode[1])
+            connect_sites(src, dst, args.no_cache)
             set_volume_replication_mode(src, dst, volume_mode)
     elif args.set_status:
         if args.data is None:
             logging.error(
                 "Replication state must be specified. Use --data 'pause' or --data 'resume'. Exiting.")
-            exit(200)
+            raise LonghornyError(200)
         else:
             state = replication_state(args.data)
             if state == 'pause' or state == 'resume':
-                logging.info("Desired replication state: " + state)
+                logging.info("Desired replication state: %s", state)
+                connect_sites(src, dst, args.no_cache)
                 set_volume_replication_state(src, dst, state)
     elif args.resize:
         if args.data is None:
             logging.error(
                 "Volume resize action requires volume size and volume ID. Use --data '1073741824;100,200' to grow 100 and 200 by 1Gi. Exiting.")
-            exit(200)
+            raise LonghornyError(200)
         else:
             data = increase_volume_size_data(args.data)
+            connect_sites(src, dst, args.no_cache)
             increase_size_of_paired_volumes(src, dst, data)
     elif args.upsize_remote:
         if args.data is None:
             logging.error(
                 "Remote volume resize action requires volume IDs of a SRC/DST pair. Use --data '100,200' to grow DST/200 to the size of SRC/100. Exiting.")
-            exit(200)
+            raise LonghornyError(200)
         else:
             data = upsize_remote_volume_data(args.data)
+            connect_sites(src, dst, args.no_cache)
             upsize_remote_volume(src, dst, data)
     else:
         logging.warning("Volume action not recognized.")
@@ -342,35 +358,61 @@ def report_volume_replication_status(
 
 def snapshot_site(src: dict, dst: dict, snap_data: list) -> dict:
     """
-    Create local crash-consistent snapshot for all individual volumes using paired volumes on SRC.
+    Create local crash-consistent group snapshot of all paired volumes on SRC.
 
+    Uses a single CreateGroupSnapshot call. If the cluster rejects it, falls back to individual snapshots of each paired volume.
     """
-    logging.warning("NOTE: If you have applications that span multiple volumes, you may need to create a dedicated group snapshot for those volumes because you may want to restore those as a group.")
     logging.warning(
-        "Taking individual snapshots at SRC using params: " +
-        str(snap_data))
+        "Taking group snapshot of paired volumes at SRC using params: %s", snap_data)
     paired_volumes = list_volume(src, dst, [])
     if paired_volumes == []:
         logging.error(
             "No paired volumes found. Ensure volumes are paired before taking a snapshot.")
-        exit(200)
+        raise LonghornyError(200)
     snapshot_retention = str(snap_data[0]) + ':00:00'  # "HH:MM:SS"
     snapshot_name = snap_data[1]
-    for v in paired_volumes:
-        try:
-            r = src['sfe'].create_snapshot(
-                v['localVolumeID'], retention=snapshot_retention, name=snapshot_name).to_json()['snapshot']
-            snap_meta = "volume ID: " + str(r['volumeID']) + ", snapshot ID: " + str(
-                r['snapshotID']) + ", snapshot name: " + str(r['name']) + ", expiration time" + str(r['expirationTime'])
-            logging.info("Snapshot created for volume ID " +
-                         str(v['localVolumeID']) + ": " + snap_meta)
-        except common.ApiServerError as e:
-            logging.error(
-                "Error creating snapshot for volume ID " +
-                str(v['localVolumeID']) +
-                ".")
-            logging.error("Error: " + str(e))
-            exit(200)
+    volume_ids = [v['localVolumeID'] for v in paired_volumes]
+    group_params = {
+        'volumes': volume_ids,
+        'name': snapshot_name,
+        'retention': snapshot_retention}
+    try:
+        r = src['sfe'].invoke_sfapi(
+            method='CreateGroupSnapshot',
+            parameters=group_params)
+        logging.info("Group snapshot ID %s created for volume IDs %s.",
+                     r['groupSnapshotID'], volume_ids)
+        for m in r['members']:
+            logging.info("Snapshot created for volume ID %s: snapshot ID: %s.",
+                         m['volumeID'], m['snapshotID'])
+        return
+    except common.ApiServerError as e:
+        logging.warning(
+            "Group snapshot failed. Falling back to individual snapshots of paired volumes. Error: %s", e)
+    logging.warning("NOTE: If you have applications that span multiple volumes, you may need to create a dedicated group snapshot for those volumes because you may want to restore those as a group.")
+    failed_volume_ids = []
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            executor.submit(
+                src['sfe'].create_snapshot,
+                v['localVolumeID'],
+                retention=snapshot_retention,
+                name=snapshot_name): v for v in paired_volumes}
+        for future in as_completed(futures):
+            v = futures[future]
+            try:
+                snap = future.result().snapshot
+                logging.info("Snapshot created for volume ID %s: volume ID: %s, snapshot ID: %s, snapshot name: %s, expiration time%s",
+                             v['localVolumeID'], snap.volume_id, snap.snapshot_id, snap.name, snap.expiration_time)
+            except common.ApiServerError as e:
+                logging.error(
+                    "Error creating snapshot for volume ID %s.", v['localVolumeID'])
+                logging.error("Error: %s", e)
+                failed_volume_ids.append(v['localVolumeID'])
+    if failed_volume_ids != []:
+        logging.error(
+            "Snapshot failed for SRC volume ID(s) %s. Exiting.", failed_volume_ids)
+        raise LonghornyError(200)
     return
 
 
@@ -382,149 +424,104 @@ def upsize_remote_volume(src: dict, dst: dict, data: list):
     This function allows the destination volume to be increased to match the source volume and replication to continue.
     As the volumes are mismatched to begin with, the function does not check multiple volume pairing details - it simply increases the size of the paired destination volume to match the source volume.
     """
-    logging.info("Attempting to grow paired DST volume ID " +
-                 str(data[1]) + " to size of SRC volume ID " + str(data[0]) + ".")
-    src_vol_params = {
-        'isPaired': True,
-        'volumeStatus': 'active',
-        'includeVirtualVolumes': False,
-        'volumeIDs': [
-            data[0]]}
-    dst_vol_params = {
-        'isPaired': True,
-        'volumeStatus': 'active',
-        'includeVirtualVolumes': False,
-        'volumeIDs': [
-            data[1]]}
-    src_vol = src['sfe'].invoke_sfapi(
-        method='ListVolumes',
-        parameters=src_vol_params)
-    dst_vol = dst['sfe'].invoke_sfapi(
-        method='ListVolumes',
-        parameters=dst_vol_params)
+    src_id, dst_id = data
+    logging.info(
+        "Attempting to grow paired DST volume ID %s to size of SRC volume ID %s.", dst_id, src_id)
+    src_vol_params = {**PAIRED_VOLUMES, 'volumeIDs': [src_id]}
+    dst_vol_params = {**PAIRED_VOLUMES, 'volumeIDs': [dst_id]}
+    src_vol, dst_vol = run_on_both_sites(
+        lambda: retry_api_call(src['sfe'].invoke_sfapi,
+                               method='ListVolumes', parameters=src_vol_params),
+        lambda: retry_api_call(dst['sfe'].invoke_sfapi,
+                               method='ListVolumes', parameters=dst_vol_params))
     if src_vol['volumes'] == [] or dst_vol['volumes'] == []:
-        logging.error("Volume ID " +
-                      str(data[0]) +
-                      " and/or " +
-                      str(data[1]) +
-                      " not found on SRC or DST cluster, respectively. Exiting.")
-        exit(200)
+        logging.error(
+            "Volume ID %s and/or %s not found on SRC or DST cluster, respectively. Exiting.", src_id, dst_id)
+        raise LonghornyError(200)
     else:
-        logging.info("Volumes found: SRC volume ID " +
-                     str(data[0]) + " and DST volume ID " + str(data[1]) + ".")
-    src_vol_mode = src_vol['volumes'][0]['access']
-    dst_vol_mode = dst_vol['volumes'][0]['access']
-    src_vol_total_size = src_vol['volumes'][0]['totalSize']
-    dst_vol_total_size = dst_vol['volumes'][0]['totalSize']
+        logging.info(
+            "Volumes found: SRC volume ID %s and DST volume ID %s.", src_id, dst_id)
+    src_rec = src_vol['volumes'][0]
+    dst_rec = dst_vol['volumes'][0]
+    src_vol_mode = src_rec['access']
+    dst_vol_mode = dst_rec['access']
+    src_vol_total_size = src_rec['totalSize']
+    dst_vol_total_size = dst_rec['totalSize']
     if not dst_vol_total_size < src_vol_total_size:
-        logging.error("SRC volume ID " +
-                      str(data[0]) +
-                      " must be larger than DST volume ID " +
-                      str(data[1][1]) +
-                      " for this action to work. Exiting.")
-        exit(200)
+        logging.error(
+            "SRC volume ID %s must be larger than DST volume ID %s for this action to work. Exiting.", src_id, dst_id)
+        raise LonghornyError(200)
     try:
-        pause_params = {'volumeID': data[0], 'pausedManual': True}
-        src['sfe'].invoke_sfapi(
-            method='ModifyVolumePair',
-            parameters=pause_params)
-        logging.info("Paused replication for SRC volume ID " +
-                     str(data[0]) + ".")
-    except BaseException:
+        pause_params = {'volumeID': src_id, 'pausedManual': True}
+        retry_api_call(src['sfe'].invoke_sfapi,
+                       method='ModifyVolumePair',
+                       parameters=pause_params)
+        logging.info("Paused replication for SRC volume ID %s.", src_id)
+    except SDK_ERRORS:
         logging.error(
-            "Error pausing replication for SRC volume ID " + str(data[0]) + ".")
-        exit(200)
+            "Error pausing replication for SRC volume ID %s.", src_id)
+        raise LonghornyError(200)
     try:
-        r = dst['sfe'].modify_volume(data[1], total_size=src_vol_total_size)
-        logging.info("Increased size of DST volume ID " +
-                     str(data[1]) + " to " + str(src_vol_total_size) + " bytes.")
+        dst_resized = retry_api_call(dst['sfe'].modify_volume,
+                                     dst_id, total_size=src_vol_total_size)
+        logging.info("Increased size of DST volume ID %s to %s bytes.",
+                     dst_id, src_vol_total_size)
     except Exception as e:
-        logging.error(
-            "Error increasing size of DST volume ID " +
-            str(
-                data[1]) +
-            " to " +
-            str(src_vol_total_size) +
-            " bytes. Please manually resize the DST volume. You may use volume --mismatched to view. Exiting.\n" +
-            str(e))
-        exit(200)
-    resume_params = {'volumeID': data[0], 'pausedManual': False}
+        logging.error("Error increasing size of DST volume ID %s to %s bytes. Please manually resize the DST volume. You may use volume --mismatched to view. Exiting.\n%s",
+                      dst_id, src_vol_total_size, e)
+        raise LonghornyError(200)
+    resume_params = {'volumeID': src_id, 'pausedManual': False}
     try:
         logging.info(
             "Will resume replication for the pair if SRC is readWrite and DST replicationTarget.")
         if src_vol_mode == 'readWrite' and dst_vol_mode == 'replicationTarget':
-            r = src['sfe'].invoke_sfapi(
-                method='ModifyVolumePair',
-                parameters=resume_params)
+            retry_api_call(src['sfe'].invoke_sfapi,
+                           method='ModifyVolumePair',
+                           parameters=resume_params)
             logging.info(
-                "Resumed replication for volume pair on SRC volume ID " + str(data[0]) + ".")
+                "Resumed replication for volume pair on SRC volume ID %s.", src_id)
         else:
-            logging.warning("Volume ID " +
-                            str(data[0]) +
-                            " is in mode " +
-                            str(src_vol_mode) +
-                            " and paired with volume ID " +
-                            str(data[1]) +
-                            " in mode " +
-                            str(dst_vol_mode) +
-                            ". Skipping attempt to resume replication.")
-    except BaseException:
+            logging.warning("Volume ID %s is in mode %s and paired with volume ID %s in mode %s. Skipping attempt to resume replication.",
+                            src_id, src_vol_mode, dst_id, dst_vol_mode)
+    except SDK_ERRORS:
         logging.error(
-            "Error resuming replication for volume ID " +
-            str(
-                data[0]) +
-            ". The volumes should be resized but replication is still paused. Try manually resuming. Exiting.")
-        exit(200)
+            "Error resuming replication for volume ID %s. The volumes should be resized but replication is still paused. Try manually resuming. Exiting.", src_id)
+        raise LonghornyError(200)
+    # DST volume record comes from the ModifyVolume response; SRC is listed
+    # again to get its replication state after resume
+    dst_final = dst_resized.to_json()['volume']
     try:
-        src_vol_final = src['sfe'].invoke_sfapi(
-            method='ListVolumes', parameters=src_vol_params)
-        dst_vol_final = dst['sfe'].invoke_sfapi(
-            method='ListVolumes', parameters=dst_vol_params)
+        src_final = retry_api_call(src['sfe'].invoke_sfapi,
+                                   method='ListVolumes', parameters=src_vol_params)['volumes'][0]
     except Exception as e:
         logging.error(
-            "Error listing volumes after DST volume resizing. Exiting.\n" +
-            str(e))
-        exit(200)
+            "Error listing volumes after DST volume resizing. Exiting.\n%s", e)
+        raise LonghornyError(200)
     src_vol_details = {
-        'volumeID': src_vol_final['volumes'][0]['volumeID'],
-        'name': src_vol_final['volumes'][0]['name'],
-        'totalSize': src_vol_final['volumes'][0]['totalSize'],
-        'access': src_vol_final['volumes'][0]['access'],
-        'state': src_vol_final['volumes'][0]['volumePairs'][0]['remoteReplication']['state'],
-        'volumePairs': src_vol_final['volumes'][0]['volumePairs'][0]['remoteVolumeID']
+        'volumeID': src_final['volumeID'],
+        'name': src_final['name'],
+        'totalSize': src_final['totalSize'],
+        'access': src_final['access'],
+        'state': src_final['volumePairs'][0]['remoteReplication']['state'],
+        'volumePairs': src_final['volumePairs'][0]['remoteVolumeID']
     }
     dst_vol_details = {
-        'volumeID': dst_vol_final['volumes'][0]['volumeID'],
-        'name': dst_vol_final['volumes'][0]['name'],
-        'totalSize': dst_vol_final['volumes'][0]['totalSize'],
-        'access': dst_vol_final['volumes'][0]['access'],
-        'volumePairs': dst_vol_final['volumes'][0]['volumePairs'][0]['remoteVolumeID']
+        'volumeID': dst_final['volumeID'],
+        'name': dst_final['name'],
+        'totalSize': dst_final['totalSize'],
+        'access': dst_final['access'],
+        'volumePairs': dst_final['volumePairs'][0]['remoteVolumeID']
     }
     if src_vol_details['totalSize'] == dst_vol_details['totalSize']:
-        logging.info("Volume ID " +
-                     str(data[0]) +
-                     " and " +
-                     str(data[1]) +
-                     " have been successfully resized to " +
-                     str(src_vol_details['totalSize']) +
-                     " bytes. (" +
-                     str(round(src_vol_details['totalSize'] /
-                               (1024 *
-                                1024 *
-                                1024), 2)) +
-                     " GiB).")
+        logging.info("Volume ID %s and %s have been successfully resized to %d bytes (%.2f GiB).",
+                     src_id, dst_id, src_vol_details['totalSize'], src_vol_details['totalSize'] / GIB)
     else:
-        logging.error("Volume ID " +
-                      str(data[0]) +
-                      " and " +
-                      str(data[1]) +
-                      " have not been resized to " +
-                      str(src_vol_details['totalSize']) +
-                      " bytes. Use volumes --mismatch to find what happened. Exiting.")
-        exit(200)
+        logging.error("Volume ID %s and %s have not been resized to %s bytes. Use volumes --mismatch to find what happened. Exiting.",
+                      src_id, dst_id, src_vol_details['totalSize'])
+        raise LonghornyError(200)
     resize_action_report = [src_vol_details, dst_vol_details]
     print("\nUPSIZE REMOTE VOLUME ACTION REPORT:\n")
-    pprint.pp(resize_action_report)
+    print_report(resize_action_report)
     return
 
 
@@ -535,345 +532,217 @@ def increase_size_of_paired_volumes(src: dict, dst: dict, data: list):
     volume --grow --data='1073741824;100,200' means grow 100 and 200 by 1Gi.
     This function first uses ListVolumes to confirm the source (volume ID) exists in readWrite access mode and is paired with a volume on the destination cluster.
     """
-    logging.info("Attempting to grow paired volumes SRC volume ID " +
-                 str(data[1][0]) +
-                 " and DST volume ID " +
-                 str(data[1][1]) +
-                 " by " +
-                 str(data[0]) +
-                 " bytes.")
-    src_vol_params = {
-        'isPaired': True,
-        'volumeStatus': 'active',
-        'includeVirtualVolumes': False,
-        'volumeIDs': [
-            data[1][0]]}
-    dst_vol_params = {
-        'isPaired': True,
-        'volumeStatus': 'active',
-        'includeVirtualVolumes': False,
-        'volumeIDs': [
-            data[1][1]]}
-    src_vol = src['sfe'].invoke_sfapi(
-        method='ListVolumes',
-        parameters=src_vol_params)
-    dst_vol = dst['sfe'].invoke_sfapi(
-        method='ListVolumes',
-        parameters=dst_vol_params)
+    grow_by, (src_id, dst_id) = data
+    logging.info("Attempting to grow paired volumes SRC volume ID %s and DST volume ID %s by %s bytes.",
+                 src_id, dst_id, grow_by)
+    src_vol_params = {**PAIRED_VOLUMES, 'volumeIDs': [src_id]}
+    dst_vol_params = {**PAIRED_VOLUMES, 'volumeIDs': [dst_id]}
+    src_vol, dst_vol = run_on_both_sites(
+        lambda: retry_api_call(src['sfe'].invoke_sfapi,
+                               method='ListVolumes', parameters=src_vol_params),
+        lambda: retry_api_call(dst['sfe'].invoke_sfapi,
+                               method='ListVolumes', parameters=dst_vol_params))
     if src_vol['volumes'] == [] or dst_vol['volumes'] == []:
-        logging.error("Volume ID " +
-                      str(data[1][0]) +
-                      " and/or " +
-                      str(data[1][1]) +
-                      " not found on SRC or DST cluster, respectively. Exiting.")
-        exit(200)
+        logging.error(
+            "Volume ID %s and/or %s not found on SRC or DST cluster, respectively. Exiting.", src_id, dst_id)
+        raise LonghornyError(200)
     else:
-        logging.info("Volumes found: SRC volume ID " +
-                     str(data[1][0]) +
-                     " and DST volume ID " +
-                     str(data[1][1]) +
-                     ".")
-    src_vol_mode = src_vol['volumes'][0]['access']
-    dst_vol_mode = dst_vol['volumes'][0]['access']
-    src_vol_total_size = src_vol['volumes'][0]['totalSize']
-    dst_vol_total_size = dst_vol['volumes'][0]['totalSize']
+        logging.info(
+            "Volumes found: SRC volume ID %s and DST volume ID %s.", src_id, dst_id)
+    src_rec = src_vol['volumes'][0]
+    dst_rec = dst_vol['volumes'][0]
+    src_vol_mode = src_rec['access']
+    dst_vol_mode = dst_rec['access']
+    src_vol_total_size = src_rec['totalSize']
+    dst_vol_total_size = dst_rec['totalSize']
     if src_vol_total_size != dst_vol_total_size:
-        logging.warning("SRC volume ID " +
-                        str(data[1][0]) +
-                        " and DST volume ID " +
-                        str(data[1][1]) +
-                        " are not the same size. Exiting.")
-        exit(200)
-    if data[0] > (src_vol_total_size * 2):
-        logging.error("SRC volume ID " +
-                      str(data[0]) +
-                      " would be increased by " +
-                      str(data[0]) +
-                      " bytes, which is more than twice its current size of " +
-                      str(src_vol_total_size) +
-                      " bytes. To avoid mistakes, this function cannot increase volume size by either more than 2x or 1 TiB at a time. Exiting.")
-        exit(200)
-    new_total_size = data[0] + src_vol_total_size
-    if new_total_size > 17592186044416:
-        logging.error("Volumes SRC/" +
-                      str(data[1][0]) +
-                      ", and DST/" +
-                      str(data[1][1]) +
-                      " would be increased to " +
-                      str(new_total_size) +
-                      " bytes, which is more than the SolidFire maximum volume size of 16 TiB. Exiting.")
-        exit(200)
+        logging.warning(
+            "SRC volume ID %s and DST volume ID %s are not the same size. Exiting.", src_id, dst_id)
+        raise LonghornyError(200)
+    if grow_by > (src_vol_total_size * 2):
+        logging.error("SRC volume ID %s would be increased by %s bytes, which is more than twice its current size of %s bytes. To avoid mistakes, this function cannot increase volume size by either more than 2x or 1 TiB at a time. Exiting.",
+                      src_id, grow_by, src_vol_total_size)
+        raise LonghornyError(200)
+    new_total_size = grow_by + src_vol_total_size
+    if new_total_size > MAX_VOLUME_BYTES:
+        logging.error("Volumes SRC/%s, and DST/%s would be increased to %s bytes, which is more than the SolidFire maximum volume size of 16 TiB. Exiting.",
+                      src_id, dst_id, new_total_size)
+        raise LonghornyError(200)
     # NOTE: we user src volume's pairing configuration and status to determine
     # if replication is paused or not
-    dst_vol_replication_state = src_vol['volumes'][0]['volumePairs'][0]['remoteReplication']['state']
-    dst_vol_id = src_vol['volumes'][0]['volumePairs'][0]['remoteVolumeID']
-    if src_vol_mode != 'readWrite' or dst_vol_id != data[1][1] or dst_vol_mode != 'replicationTarget':
-        logging.error("Volume ID " +
-                      str(data[1][0]) +
-                      " is in mode " +
-                      str(src_vol_mode) +
-                      " and paired with volume ID " +
-                      str(dst_vol_id) +
-                      " with replication state " +
-                      str(dst_vol_replication_state) +
-                      ".")
-        exit(200)
+    dst_vol_replication_state = src_rec['volumePairs'][0]['remoteReplication']['state']
+    dst_vol_id = src_rec['volumePairs'][0]['remoteVolumeID']
+    if src_vol_mode != 'readWrite' or dst_vol_id != dst_id or dst_vol_mode != 'replicationTarget':
+        logging.error("Volume ID %s is in mode %s and paired with volume ID %s with replication state %s.",
+                      src_id, src_vol_mode, dst_vol_id, dst_vol_replication_state)
+        raise LonghornyError(200)
     else:
-        logging.info("Volume ID " +
-                     str(data[1][0]) +
-                     " is in " +
-                     str(src_vol_mode) +
-                     " mode, paired with " +
-                     str(dst_vol_id) +
-                     " in replication state " +
-                     str(dst_vol_replication_state) +
-                     ". Continuing.")
+        logging.info("Volume ID %s is in %s mode, paired with %s in replication state %s. Continuing.",
+                     src_id, src_vol_mode, dst_vol_id, dst_vol_replication_state)
     try:
-        pause_params = {'volumeID': data[1][0], 'pausedManual': True}
-        src['sfe'].invoke_sfapi(
-            method='ModifyVolumePair',
-            parameters=pause_params)
-        logging.info("Paused replication for SRC volume ID " +
-                     str(data[1][0]) + ".")
-    except BaseException:
+        pause_params = {'volumeID': src_id, 'pausedManual': True}
+        retry_api_call(src['sfe'].invoke_sfapi,
+                       method='ModifyVolumePair',
+                       parameters=pause_params)
+        logging.info("Paused replication for SRC volume ID %s.", src_id)
+    except SDK_ERRORS:
         logging.error(
-            "Error pausing replication for SRC volume ID " + str(data[1][0]) + ".")
-        exit(200)
+            "Error pausing replication for SRC volume ID %s.", src_id)
+        raise LonghornyError(200)
     try:
-        r = dst['sfe'].modify_volume(data[1][1], total_size=new_total_size)
-        logging.info("Increased size of DST volume ID " +
-                     str(data[1][0]) + " to " + str(data[0]) + " bytes.")
+        dst_resized = retry_api_call(dst['sfe'].modify_volume,
+                                     dst_id, total_size=new_total_size)
+        logging.info(
+            "Increased size of DST volume ID %s to %s bytes.", dst_id, new_total_size)
     except Exception as e:
-        logging.error("Error increasing size of DST volume ID " +
-                      str(data[1][1]) +
-                      " to " +
-                      str(data[0]) +
-                      " bytes. Please manually resize the DST volume. You may use volume --mismatched to view. Exiting.\n" +
-                      str(e))
-        exit(200)
+        logging.error(
+            "Error increasing size of DST volume ID %s to %s bytes. Please manually resize the DST volume. You may use volume --mismatched to view. Exiting.\n%s", dst_id, new_total_size, e)
+        raise LonghornyError(200)
     try:
         logging.info("Size of the destination volume has been increased.")
-        r = src['sfe'].modify_volume(data[1][0], total_size=new_total_size)
-        logging.info("Increased size of SRC volume ID " +
-                     str(data[1][0]) + " to " + str(new_total_size) + " bytes.")
+        retry_api_call(src['sfe'].modify_volume,
+                       src_id, total_size=new_total_size)
+        logging.info("Increased size of SRC volume ID %s to %s bytes.",
+                     src_id, new_total_size)
     except Exception as e:
-        logging.error(
-            "Error increasing size of volume " +
-            str(
-                data[1][0]) +
-            " to " +
-            str(new_total_size) +
-            " bytes. Please manually resize the SRC volume and set replication to resume. You may use volume --mismatched to view. Exiting.\n" +
-            str(e))
-        exit(200)
-    resume_params = {'volumeID': data[1][0], 'pausedManual': True}
+        logging.error("Error increasing size of volume %s to %s bytes. Please manually resize the SRC volume and set replication to resume. You may use volume --mismatched to view. Exiting.\n%s",
+                      src_id, new_total_size, e)
+        raise LonghornyError(200)
+    resume_params = {'volumeID': src_id, 'pausedManual': False}
     try:
         logging.info("Resuming replication for volume pair.")
-        r = src['sfe'].invoke_sfapi(
-            method='ModifyVolumePair',
-            parameters=resume_params)
+        retry_api_call(src['sfe'].invoke_sfapi,
+                       method='ModifyVolumePair',
+                       parameters=resume_params)
         logging.info(
-            "Resumed replication for volume pair on SRC volume ID " + str(data[1][0]) + ".")
-    except BaseException:
+            "Resumed replication for volume pair on SRC volume ID %s.", src_id)
+    except SDK_ERRORS:
         logging.error(
-            "Error resuming replication for volume ID " +
-            str(
-                data[1][0]) +
-            ". The volumes should be resized but replication is still paused. Try manually resuming. Exiting.")
-        exit(200)
+            "Error resuming replication for volume ID %s. The volumes should be resized but replication is still paused. Try manually resuming. Exiting.", src_id)
+        raise LonghornyError(200)
+    # DST volume record comes from the ModifyVolume response; SRC is listed
+    # again to get its replication state after resume
+    dst_final = dst_resized.to_json()['volume']
     try:
-        src_vol_final = src['sfe'].invoke_sfapi(
-            method='ListVolumes', parameters=src_vol_params)
-        dst_vol_final = dst['sfe'].invoke_sfapi(
-            method='ListVolumes', parameters=dst_vol_params)
+        src_final = retry_api_call(src['sfe'].invoke_sfapi,
+                                   method='ListVolumes', parameters=src_vol_params)['volumes'][0]
     except Exception as e:
-        logging.error(
-            "Error listing volumes after resizing. Exiting.\n" +
-            str(e))
-        exit(200)
+        logging.error("Error listing volumes after resizing. Exiting.\n%s", e)
+        raise LonghornyError(200)
     src_vol_details = {
-        'volumeID': src_vol_final['volumes'][0]['volumeID'],
-        'name': src_vol_final['volumes'][0]['name'],
-        'totalSize': src_vol_final['volumes'][0]['totalSize'],
-        'access': src_vol_final['volumes'][0]['access'],
-        'state': src_vol_final['volumes'][0]['volumePairs'][0]['remoteReplication']['state'],
-        'volumePairs': src_vol_final['volumes'][0]['volumePairs'][0]['remoteVolumeID']
+        'volumeID': src_final['volumeID'],
+        'name': src_final['name'],
+        'totalSize': src_final['totalSize'],
+        'access': src_final['access'],
+        'state': src_final['volumePairs'][0]['remoteReplication']['state'],
+        'volumePairs': src_final['volumePairs'][0]['remoteVolumeID']
     }
     dst_vol_details = {
-        'volumeID': dst_vol_final['volumes'][0]['volumeID'],
-        'name': dst_vol_final['volumes'][0]['name'],
-        'totalSize': dst_vol_final['volumes'][0]['totalSize'],
-        'access': dst_vol_final['volumes'][0]['access'],
-        'volumePairs': dst_vol_final['volumes'][0]['volumePairs'][0]['remoteVolumeID']
+        'volumeID': dst_final['volumeID'],
+        'name': dst_final['name'],
+        'totalSize': dst_final['totalSize'],
+        'access': dst_final['access'],
+        'volumePairs': dst_final['volumePairs'][0]['remoteVolumeID']
     }
     if src_vol_details['totalSize'] == dst_vol_details['totalSize']:
-        logging.info("Volume ID " +
-                     str(data[1][0]) +
-                     " and " +
-                     str(data[1][1]) +
-                     " have been successfully resized to " +
-                     str(src_vol_details['totalSize']) +
-                     " bytes. (" +
-                     str(round(src_vol_details['totalSize'] /
-                               (1024 *
-                                1024 *
-                                1024), 2)) +
-                     " GiB).")
+        logging.info("Volume ID %s and %s have been successfully resized to %d bytes (%.2f GiB).",
+                     src_id, dst_id, src_vol_details['totalSize'], src_vol_details['totalSize'] / GIB)
     else:
-        logging.error("Volume ID " +
-                      str(data[1][0]) +
-                      " and " +
-                      str(data[1][1]) +
-                      " have not been resized to " +
-                      str(src_vol_details['totalSize']) +
-                      " bytes. Use volumes --mismatch to find what happened. Exiting.")
-        exit(200)
+        logging.error("Volume ID %s and %s have not been resized to %s bytes. Use volumes --mismatch to find what happened. Exiting.",
+                      src_id, dst_id, src_vol_details['totalSize'])
+        raise LonghornyError(200)
     resize_action_report = [src_vol_details, dst_vol_details]
     print("\nRESIZE ACTION REPORT:\n")
-    pprint.pp(resize_action_report)
+    print_report(resize_action_report)
     return
 
 
+def index_paired_volumes(volumes: list) -> tuple:
+    """
+    Index paired volumes from ListVolumes in a single pass.
+
+    Returns a dict of volumePairUUID to (volumeID, remoteVolumeID), a set of (volumeID, remoteVolumeID) tuples and a set of account IDs.
+    """
+    by_uuid = {}
+    pair_set = set()
+    accounts = set()
+    for v in volumes:
+        vp = v['volumePairs'][0]
+        ids = (v['volumeID'], vp['remoteVolumeID'])
+        pair_set.add(ids)
+        accounts.add(v['accountID'])
+        by_uuid[vp['volumePairUUID']] = ids
+    return by_uuid, pair_set, accounts
+
+
 def list_mismatched_pairs(src: dict, dst: dict) -> dict:
     """
     List mismatched volume pairs.
 
     Mismatched pairs are those for which there's a unilateral pairing, volume sizes do not match or something else appears wrong.
     """
+    src_name = src['clusterName']
+    dst_name = dst['clusterName']
     params = {'isPaired': True}
     existing_pairs = {}
-    src_pairs = src['sfe'].invoke_sfapi(
-        method='ListVolumes',
-        parameters=params)['volumes']
-    dst_pairs = dst['sfe'].invoke_sfapi(
-        method='ListVolumes',
-        parameters=params)['volumes']
-    src_ids = [(i['volumeID'], i['volumePairs'][0]['remoteVolumeID'])
-               for i in src_pairs]
-    dst_ids = [(i['volumeID'], i['volumePairs'][0]['remoteVolumeID'])
-               for i in dst_pairs]
-    if len(src_ids) != len(dst_ids):
-        logging.warning("SRC and DST have different number of volume pairings at SRC/DST: " +
-                        str(len(src_ids)) + "/" + str(len(dst_ids)) + ".")
-    src_account_ids = [(i['volumeID'], i['accountID']) for i in src_pairs]
-    dst_account_ids = [(i['volumeID'], i['accountID']) for i in dst_pairs]
-    if len(set([i[1] for i in src_account_ids])) > 1:
-        logging.warning("Multiple account IDs found on paired volumes at SRC: " +
-                        str(len(set([i[1] for i in src_account_ids]))) + ".")
-    if len(set([i[1] for i in dst_account_ids])) > 1:
-        logging.warning("Multiple account IDs found on paired volumes at DST: " +
-                        str(len(set([i[1] for i in dst_account_ids]))) + ".")
-    mismatch = []
-    for p in src_ids:
-        pr = (p[1], p[0])
-        if pr not in dst_ids:
-            logging.warning("Volume ID " +
-                            str(p[0]) +
-                            " is paired on SRC but not on DST cluster.")
-    for p in dst_ids:
-        pr = (p[1], p[0])
-        if pr not in src_ids:
-            logging.warning("Volume ID " +
-                            str(p[0]) +
-                            " is paired on DST but not on SRC cluster.")
-    if len(src_ids) == 0 and len(dst_ids) == 0:
+    src_resp, dst_resp = run_on_both_sites(
+        lambda: retry_api_call(src['sfe'].invoke_sfapi,
+                               method='ListVolumes', parameters=params),
+        lambda: retry_api_call(dst['sfe'].invoke_sfapi,
+                               method='ListVolumes', parameters=params))
+    src_by_uuid, src_pair_set, src_accounts = index_paired_volumes(
+        src_resp['volumes'])
+    dst_by_uuid, dst_pair_set, dst_accounts = index_paired_volumes(
+        dst_resp['volumes'])
+    if len(src_pair_set) != len(dst_pair_set):
+        logging.warning(
+            "SRC and DST have different number of volume pairings at SRC/DST: %s/%s.", len(src_pair_set), len(dst_pair_set))
+    n_src_accts = len(src_accounts)
+    n_dst_accts = len(dst_accounts)
+    if n_src_accts > 1:
+        logging.warning(
+            "Multiple account IDs found on paired volumes at SRC: %d.", n_src_accts)
+    if n_dst_accts > 1:
+        logging.warning(
+            "Multiple account IDs found on paired volumes at DST: %d.", n_dst_accts)
+    # (remoteVolumeID, volumeID) as seen from the other site
+    src_reverse_set = {(rvid, vid) for vid, rvid in src_pair_set}
+    dst_reverse_set = {(rvid, vid) for vid, rvid in dst_pair_set}
+    for vid, rvid in sorted(src_pair_set - dst_reverse_set):
+        logging.warning(
+            "Volume ID %s is paired on SRC but not on DST cluster.", vid)
+    for vid, rvid in sorted(dst_pair_set - src_reverse_set):
+        logging.warning(
+            "Volume ID %s is paired on DST but not on SRC cluster.", vid)
+    if not src_pair_set and not dst_pair_set:
         logging.warning("No volumes found on one or both sides.")
         return
-    elif len(src_ids) == 0 or len(dst_ids) == 0:
+    elif not src_pair_set or not dst_pair_set:
         logging.warning(
-            "One or both sides have no paired volumes. Number of paired volumes at SRC/DST:" +
-            len(src_ids) +
-            "/" +
-            len(dst_ids) +
-            ".")
+            "One or both sides have no paired volumes. Number of paired volumes at SRC/DST:%s/%s.", len(src_pair_set), len(dst_pair_set))
         return
     else:
-        site_pairs = {}
-        s_list = []
-        for pair in src_pairs:
-            kvs = {
-                'accountID': pair['accountID'],
-                'volumeID': pair['volumeID'],
-                'name': pair['name'],
-                'deleteTime': pair['deleteTime'],
-                'purgeTime': pair['purgeTime'],
-                'totalSize': pair['totalSize'],
-                'enable512e': pair['enable512e'],
-                'volumePairUUID': pair['volumePairs'][0]['volumePairUUID'],
-                'remoteVolumeID': pair['volumePairs'][0]['remoteVolumeID'],
-                'remoteVolumeName': pair['volumePairs'][0]['remoteVolumeName']
-            }
-            if 'qos' in pair.keys():
-                qos = pair['qos']
-                pair['qos'] = qos
-            else:
-                qos_policy_id = pair['qosPolicyID']
-                pair['qosPolicyID'] = qos_policy_id
-            s_list.append(kvs)
-        site_pairs[src['clusterName']] = s_list
-        d_list = []
-        for pair in dst_pairs:
-            kvs = {
-                'accountID': pair['accountID'],
-                'volumeID': pair['volumeID'],
-                'name': pair['name'],
-                'deleteTime': pair['deleteTime'],
-                'purgeTime': pair['purgeTime'],
-                'totalSize': pair['totalSize'],
-                'enable512e': pair['enable512e'],
-                'volumePairUUID': pair['volumePairs'][0]['volumePairUUID'],
-                'remoteVolumeID': pair['volumePairs'][0]['remoteVolumeID'],
-                'remoteVolumeName': pair['volumePairs'][0]['remoteVolumeName']
-            }
-            if 'qos' in pair.keys():
-                pair['qos'] = qos
-            else:
-                qos_policy_id = pair['qosPolicyID']
-                pair['qosPolicyID'] = qos_policy_id
-            d_list.append(kvs)
-        site_pairs[dst['clusterName']] = d_list
         unique = []
-        for i in site_pairs[src['clusterName']]:
-            mismatch = {}
-            if i['volumePairUUID'] not in (
-                    j['volumePairUUID'] for j in site_pairs[dst['clusterName']]):
-                mismatch[src['clusterName']] = {
-                    'volumeID': i['volumeID'],
-                    'volumePairUUID': i['volumePairUUID'],
-                    'volumePairUUID': i['volumePairUUID'],
-                    'mismatchSite': dst['clusterName'],
-                    'remoteVolumeID': i['remoteVolumeID']}
-                logging.warning("Mismatch found at SRC: vol ID " +
-                                str(i['volumeID']) +
-                                " in relationship " +
-                                str(i['volumePairUUID']) +
-                                " found at SRC, but relationship from paired SRC volume ID is missing: " +
-                                str(i['remoteVolumeID']) +
-                                ".")
-                unique.append(mismatch)
-            else:
-                pass
-        for i in site_pairs[dst['clusterName']]:
-            mismatch = {}
-            if i['volumePairUUID'] not in (
-                    j['volumePairUUID'] for j in site_pairs[src['clusterName']]):
-                mismatch[dst['clusterName']] = {
-                    'volumeID': i['volumeID'],
-                    'volumePairUUID': i['volumePairUUID'],
-                    'remoteSite': src['clusterName'],
-                    'remoteVolumeID': i['remoteVolumeID']}
-                logging.warning("Mismatch found at DST: vol ID " +
-                                str(i['volumeID']) +
-                                " in relationship " +
-                                str(i['volumePairUUID']) +
-                                " found at SRC, but relationship from paired SRC volume ID is missing: " +
-                                str(i['remoteVolumeID']) +
-                                ".")
-                unique.append(mismatch)
-            else:
-                pass
+        for uuid, (vid, rvid) in src_by_uuid.items():
+            if uuid not in dst_by_uuid:
+                logging.warning("Mismatch found at SRC: vol ID %s in relationship %s found at SRC, but relationship from paired SRC volume ID is missing: %s.",
+                                vid, uuid, rvid)
+                unique.append({src_name: {
+                    'volumeID': vid,
+                    'volumePairUUID': uuid,
+                    'mismatchSite': dst_name,
+                    'remoteVolumeID': rvid}})
+        for uuid, (vid, rvid) in dst_by_uuid.items():
+            if uuid not in src_by_uuid:
+                logging.warning("Mismatch found at DST: vol ID %s in relationship %s found at SRC, but relationship from paired SRC volume ID is missing: %s.",
+                                vid, uuid, rvid)
+                unique.append({dst_name: {
+                    'volumeID': vid,
+                    'volumePairUUID': uuid,
+                    'remoteSite': src_name,
+                    'remoteVolumeID': rvid}})
         print("\nMISMATCHED PAIRED VOLUMES ONLY:\n")
-        pprint.pp(unique)
+        print_report(unique)
     return
 
 
@@ -885,135 +754,114 @@ def prime_destination_volumes(src, dst, data):
     """
     try:
         try:
-            src_account_vols = src['sfe'].list_volumes_for_account(data[0][0]).to_json()[
+            src_account_vols = retry_api_call(src['sfe'].list_volumes_for_account, data[0][0]).to_json()[
                 'volumes']
-        except BaseException:
+        except SDK_ERRORS:
             logging.error(
-                "Error getting account volumes for source site account ID: " +
-                str(
-                    data[0][0]) +
-                ". Make sure the account ID exists. Exiting.")
-            exit(200)
-        # list of SRC Volume IDs to be used as templates
-        src_vid = [i for i in data[1]]
-        for v in src_account_vols:
-            if v['volumeID'] in src_vid:
-                logging.info("Volume ID " + str(v['volumeID']) + " found to belong to account ID " + str(
-                    data[0][0]) + ". Checking the volume for existing replication relationships (must be none).")
-                if 'volumePairs' in v.keys() and v['volumePairs'] != []:
-                    logging.error("Error: Volume ID " +
-                                  str(v['volumeID']) +
-                                  " has replication relationships. Volumes used for priming must not be already paired. Exiting.")
-                    exit(200)
-    except BaseException:
-        logging.error(
-            "Error getting account volumes for account ID: " +
-            str(
-                data[0][0]) +
-            ". All of the SRC volume IDs must be owned by the specific SRC account ID. Exiting.")
-        exit(200)
-    src_volumes = []
-    for v in src_account_vols:
-        if v['volumeID'] in src_vid:  # skip volumes not in the DATA list of volume IDs
-            if 'qos' in v.keys():
-                src_volume = {
-                    'volumeID': v['volumeID'],
-                    'enable512e': v['enable512e'],
-                    'fifoSize': v['fifoSize'],
-                    'minFifoSize': v['minFifoSize'],
-                    'name': v['name'],
-                    'qos': v['qos'],
-                    'totalSize': v['totalSize']}
+                "Error getting account volumes for source site account ID: %s. Make sure the account ID exists. Exiting.", data[0][0])
+            raise LonghornyError(200)
+        # SRC Volume IDs to be used as templates, in --data order and without duplicates
+        src_vid = list(dict.fromkeys(data[1]))
+        vols_by_id = {v['volumeID']: v for v in src_account_vols}
+        src_volumes = []
+        for vid in src_vid:
+            v = vols_by_id.get(vid)
+            if v is None:
+                logging.warning(
+                    "Volume ID %s not found among volumes of account ID %s. Skipping.", vid, data[0][0])
+                continue
+            logging.info(
+                "Volume ID %s found to belong to account ID %s. Checking the volume for existing replication relationships (must be none).", vid, data[0][0])
+            if v.get('volumePairs'):
+                logging.error(
+                    "Error: Volume ID %s has replication relationships. Volumes used for priming must not be already paired. Exiting.", vid)
+                raise LonghornyError(200)
+            src_volume = {
+                'volumeID': vid,
+                'enable512e': v['enable512e'],
+                'fifoSize': v['fifoSize'],
+                'minFifoSize': v['minFifoSize'],
+                'name': v['name'],
+                'totalSize': v['totalSize']}
+            if 'qos' in v:
+                src_volume['qos'] = v['qos']
             else:
-                src_volume = {
-                    'volumeID': v['volumeID'],
-                    'enable512e': v['enable512e'],
-                    'fifoSize': v['fifoSize'],
-                    'minFifoSize': v['minFifoSize'],
-                    'name': v['name'],
-                    'qosPolicyID': v['qosPolicyID'],
-                    'totalSize': v['totalSize']}
+                src_volume['qosPolicyID'] = v['qosPolicyID']
             src_volumes.append(src_volume)
+    except (KeyError, TypeError):
+        logging.error(
+            "Error getting account volumes for account ID: %s. All of the SRC volume IDs must be owned by the specific SRC account ID. Exiting.", data[0][0])
+        raise LonghornyError(200)
     logging.warning(
         "SRC volumes to be used as template for volume creation on DST cluster:")
-    pprint.pp(src_volumes)
+    print_report(src_volumes)
     try:
-        dst_account_id = dst['sfe'].get_account_by_id(data[0][1]).to_json()[
-            'account']['accountID']
+        dst_account_id = retry_api_call(
+            dst['sfe'].get_account_by_id, data[0][1]).account.account_id
         if dst_account_id == data[0][1]:
             print("DST account exists (DATA vs API response): " +
                   str(data[0][1]) + "," + str(dst_account_id) + ".")
-            logging.info("DST account exists (DATA vs API response): " +
-                         str(data[0][1]) + "," + str(dst_account_id) + ".")
-    except BaseException:
-        logging.error("DST account ID " +
-                      str(data[0][1]) +
-                      " does not exist or cannot be queried. Exiting.")
-        exit(200)
+            logging.info(
+                "DST account exists (DATA vs API response): %s,%s.", data[0][1], dst_account_id)
+    except SDK_ERRORS:
+        logging.error(
+            "DST account ID %s does not exist or cannot be queried. Exiting.", data[0][1])
+        raise LonghornyError(200)
     dst_volumes = []
+    create_params = []
     for v in src_volumes:
-        if 'qos' in v.keys():
-            params = {
-                'accountID': dst_account_id,
-                'name': v['name'],
-                'totalSize': v['totalSize'],
-                'enable512e': v['enable512e'],
-                'qos': v['qos'],
-                'fifoSize': v['fifoSize'],
-                'minFifoSize': v['minFifoSize']}
+        params = {
+            'accountID': dst_account_id,
+            'name': v['name'],
+            'totalSize': v['totalSize'],
+            'enable512e': v['enable512e'],
+            'fifoSize': v['fifoSize'],
+            'minFifoSize': v['minFifoSize']}
+        if 'qos' in v:
+            params['qos'] = v['qos']
         else:
             print(
                 "QoS not found in volume properties. Using qosPolicyID instead:",
                 v['qosPolicyID'])
-            params = {
-                'accountID': dst_account_id,
-                'name': v['name'],
-                'totalSize': v['totalSize'],
-                'enable512e': v['enable512e'],
-                'qosPolicyID': v['qos'],
-                'fifoSize': v['fifoSize'],
-                'minFifoSize': v['minFifoSize']}
-        try:
+            params['qosPolicyID'] = v['qosPolicyID']
+        create_params.append((v['volumeID'], params))
+    failed = False
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {}
+        for src_volume_id, params in create_params:
             logging.info(
-                "Creating volume on DST cluster using params: " +
-                str(params) +
-                ".")
-            dst_volume = dst['sfe'].invoke_sfapi(
-                method='CreateVolume', parameters=params)
-            dst_volumes.append(
-                (v['volumeID'], dst_volume['volume']['volumeID']))
-        except ApiServerError as e:
-            logging.error("Error creating volume on DST cluster: " + str(e))
-            exit(200)
+                "Creating volume on DST cluster using params: %s.", params)
+            futures[executor.submit(
+                dst['sfe'].invoke_sfapi,
+                method='CreateVolume',
+                parameters=params)] = src_volume_id
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            try:
+                dst_volume = future.result()
+                dst_volumes.append(
+                    (futures[future], dst_volume['volume']['volumeID']))
+            except SDK_ERRORS as e:
+                logging.error("Error creating volume on DST cluster: %s", e)
+                if not failed:
+                    failed = True
+                    for f in futures:
+                        f.cancel()
+    # keep the order of SRC volume IDs from --data
+    src_order = {vid: i for i, vid in enumerate(src_vid)}
+    dst_volumes.sort(key=lambda i: src_order[i[0]])
+    if failed:
+        logging.error("Volumes created on DST cluster before the error [(SRC,DST)..]: %s. Exiting.",
+                      dst_volumes)
+        raise LonghornyError(200)
     try:
-        if len(dst_volumes) < 500:
-            logging.info(
-                "Less than 500 volumes to be modified. Using the bulk volume modification API.")
-            r = dst['sfe'].modify_volumes(
-                [i[1] for i in dst_volumes], access='replicationTarget')
-        else:
-            logging.info(
-                "More than 500 volumes to be modified. Using the individual volume modification API. Inspect DST for correctness before pairing.")
-            for i in dst_volumes:
-                try:
-                    r = dst['sfe'].modify_volume(
-                        i[1], access='replicationTarget')
-                    logging.info("Modified volume ID " +
-                                 str(i[1]) +
-                                 " to access mode replicationTarget.")
-                except ApiServerError as e:
-                    logging.error(
-                        "Error modifying volume ID " +
-                        str(
-                            i[1]) +
-                        " to access mode replicationTarget. Exiting loop to prevent massive mismatches in access mode of new volumes at DST.")
-                    logging.error("Error: " + str(e))
-                    exit(200)
+        bulk_modify_volumes(dst['sfe'], [i[1] for i in dst_volumes],
+                            access='replicationTarget')
     except ApiServerError as e:
         print("API server response code: ", e)
         logging.warning(
-            "setting DST volumes to access mode: replicationTarget. Please review and remediate. API server message: ",
-            str(e))
+            "setting DST volumes to access mode: replicationTarget. Please review and remediate. API server message: %s", e)
     if dst_volumes != []:
         print("DST volumes created [(SRC,DST)..]: " +
               str([i[1] for i in dst_volumes]))
@@ -1024,118 +872,122 @@ def prime_destination_volumes(src, dst, data):
             "\"" +
             dst_volumes_str +
             "\".")
-        pprint.pp(dst_volumes)
+        print_report(dst_volumes)
     return
 
 
-def list_volume(src: dict, dst: dict, volume_pair: list) -> dict:
+def list_volume(src: dict, dst: dict, volume_pair: list,
+                src_volumes: list = None) -> dict:
     """
     List mutually paired volumes on SRC and DST cluster.
 
     If volume pair list is not provided, list all mutually paired volumes.
     If volume pair list is provided, list only those volume pairs if such pair(s) exist in a paired relationship.
     Volumes paired asymmetrically (one-sided, or different volume sizes) are not listed as they're considered mismatched (see volume --mismatch).
+    Pass src_volumes (SRC ListVolumes result for paired volumes) if the caller has already fetched it.
     """
     pairing = get_exclusive_cluster_pairing(src, dst)
     if pairing == {}:
         logging.error(
             "Clusters are already paired with more than one cluster or in an incomplete pairing state. Use cluster --list to view current status.")
-        exit(200)
+        raise LonghornyError(200)
     paired_volumes = []
     if volume_pair == []:
         logging.info(
             "No volume pair data provided. Listing all paired active volumes.")
-        params = {
-            'isPaired': True,
-            'volumeStatus': 'active',
-            'includeVirtualVolumes': False}
-        volume = src['sfe'].invoke_sfapi(
-            method='ListVolumes', parameters=params)['volumes']
+        if src_volumes is None:
+            src_volumes = retry_api_call(src['sfe'].invoke_sfapi,
+                                         method='ListVolumes', parameters=PAIRED_VOLUMES)['volumes']
+        volume = src_volumes
     elif isinstance(volume_pair, list):
         volume_ids = []
         for i in volume_pair:
             if not isinstance(i, tuple):
                 logging.error("Volume pair data not understood. Exiting.")
-                exit(200)
+                raise LonghornyError(200)
             else:
                 volume_ids.append(int(i[0]))
-        params = {
-            'volumeIDs': volume_ids,
-            'isPaired': True,
-            'volumeStatus': 'active',
-            'includeVirtualVolumes': False}
-        volume = src['sfe'].invoke_sfapi(
-            method='ListVolumes', parameters=params)['volumes']
+        params = {**PAIRED_VOLUMES, 'volumeIDs': volume_ids}
+        volume = retry_api_call(src['sfe'].invoke_sfapi,
+                                method='ListVolumes', parameters=params)['volumes']
+    else:
+        logging.error("Volume pair data not understood. Exiting.")
+        raise LonghornyError(200)
+    expected_cpid = pairing[src['clusterName']][0]['clusterPairID']
+    for v, rr in valid_volume_pairs(volume, expected_cpid):
+        paired_info = {
+            'clusterPairID': rr['clusterPairID'],
+            'localVolumeID': v['volumeID'],
+            'localVolumeName': v['name'],
+            'remoteVolumeName': rr['remoteVolumeName'],
+            'remoteReplicationMode': rr['remoteReplication']['mode'],
+            'remoteReplicationPauseLimit': rr['remoteReplication']['pauseLimit'],
+            'remoteReplicationStateSnapshots': rr['remoteReplication']['snapshotReplication']['state'],
+            'remoteReplicationState': rr['remoteReplication']['snapshotReplication']['state'],
+            'remoteVolumeID': rr['remoteVolumeID'],
+            'volumePairUUID': rr['volumePairUUID']
+        }
+        logging.info("Paired volume found for SRC volume ID %s, name %s - remote volume %s, name %s.",
+                     v['volumeID'], v['volumeID'], rr['remoteVolumeID'], rr['remoteVolumeName'])
+        paired_volumes.append(paired_info)
+    if volume_pair == []:
+        print("\nPAIRED VOLUMES REPORT:\n")
+        print_report(paired_volumes)
+    elif isinstance(volume_pair, list):
+        print(
+            "\nVOLUMES REPORT FOR SPECIFIED VOLUME PAIR(S): " +
+            str(volume_pair) +
+            "\n")
+        print_report(paired_volumes)
     else:
         logging.error("Volume pair data not understood. Exiting.")
-        exit(200)
-    for v in volume:
-        if 'volumePairs' in v.keys() and v['volumePairs'] != []:
+        raise LonghornyError(200)
+    return paired_volumes
+
+
+def valid_volume_pairs(volumes: list, expected_cpid: int):
+    """
+    Yield (volume, volumePairs entry) for SRC volumes from ListVolumes that have exactly one pairing, through cluster pair expected_cpid.
+
+    Exits if a volume is paired through any other cluster pair. Volumes with more than one pairing are skipped with a warning.
+    """
+    for v in volumes:
+        if v.get('volumePairs'):
             if v['volumePairs'] is not None and not len(v['volumePairs']) > 1:
                 for rr in v['volumePairs']:
-                    if rr['clusterPairID'] != pairing[src['clusterName']
-                                                      ][0]['clusterPairID']:
+                    if rr['clusterPairID'] != expected_cpid:
                         print("Suspicious volume:", str(v['volumeID']) +
                               " Name: " +
                               v['name'], "with pairing *cluster* relationship ID", rr['clusterPairID'], "does not match the cluster pair ID " +
-                              str(pairing[src['clusterName']][0]['clusterPairID']) +
+                              str(expected_cpid) +
                               ". Ensure the volume is not paired. Exiting.")
-                        logging.error("Found volume paired with with a cluster other than DST. Exiting. Use cluster --list or volume --list to verify one-to-one cluster peering relationship. Unknown clusterPairID " + str(
-                            rr['clusterPairID']) + " found for volume ID/name:" + str(v['volumeID']) + ", " + v['name'] + ".")
-                        exit(200)
+                        logging.error("Found volume paired with with a cluster other than DST. Exiting. Use cluster --list or volume --list to verify one-to-one cluster peering relationship. Unknown clusterPairID %s found for volume ID/name:%s, %s.",
+                                      rr['clusterPairID'], v['volumeID'], v['name'])
+                        raise LonghornyError(200)
                     else:
-                        logging.info("Confirmed that volume" +
-                                     str(v['volumeID']) +
-                                     " is paired with clusterPairID " +
-                                     str(pairing[src['clusterName']][0]['clusterPairID']) +
-                                     ".")
-                        paired_info = {
-                            'clusterPairID': rr['clusterPairID'],
-                            'localVolumeID': v['volumeID'],
-                            'localVolumeName': v['name'],
-                            'remoteVolumeName': rr['remoteVolumeName'],
-                            'remoteReplicationMode': rr['remoteReplication']['mode'],
-                            'remoteReplicationPauseLimit': rr['remoteReplication']['pauseLimit'],
-                            'remoteReplicationStateSnapshots': rr['remoteReplication']['snapshotReplication']['state'],
-                            'remoteReplicationState': rr['remoteReplication']['snapshotReplication']['state'],
-                            'remoteVolumeID': rr['remoteVolumeID'],
-                            'volumePairUUID': rr['volumePairUUID']
-                        }
-                        logging.info("Paired volume found for SRC volume ID " +
-                                     str(v['volumeID']) +
-                                     ", name " +
-                                     str(v['volumeID']) +
-                                     " - remote volume " +
-                                     str(rr['remoteVolumeID']) +
-                                     ", name " +
-                                     str(rr['remoteVolumeName']) +
-                                     ".")
-                        paired_volumes.append(paired_info)
+                        logging.info("Confirmed that volume%s is paired with clusterPairID %s.",
+                                     v['volumeID'], expected_cpid)
+                        yield v, rr
             else:
                 print(
                     "Suspicious volume:", str(
                         v['volumeID']) + " Name: " + v['name'])
                 logging.warning(
-                    "Volume is paired with more than one volume. Use cluster --list to verify one-to-one cluster peering relationship. Volume ID and name:" +
-                    str(
-                        v['volumeID']) +
-                    "," +
-                    v['name'])
+                    "Volume is paired with more than one volume. Use cluster --list to verify one-to-one cluster peering relationship. Volume ID and name:%s,%s", v['volumeID'], v['name'])
         else:
-            logging.info("No paired volumes found for volume" + v['name'])
-    if volume_pair == []:
-        print("\nPAIRED VOLUMES REPORT:\n")
-        pprint.pp(paired_volumes)
-    elif isinstance(volume_pair, list):
-        print(
-            "\nVOLUMES REPORT FOR SPECIFIED VOLUME PAIR(S): " +
-            str(volume_pair) +
-            "\n")
-        pprint.pp(paired_volumes)
-    else:
-        logging.error("Volume pair data not understood. Exiting.")
-        exit(200)
-    return paired_volumes
+            logging.info("No paired volumes found for volume%s", v['name'])
+
+
+def paired_volume_ids(paired_volumes: list) -> tuple:
+    """
+    Return lists of SRC (local) and DST (remote) volume IDs from list_volume output in one pass.
+    """
+    src_ids = []
+    dst_ids = []
+    for item in paired_volumes:
+        src_ids.append(item['localVolumeID'])
+        dst_ids.append(item['remoteVolumeID'])
+    return src_ids, dst_ids
 
 
 def pair_volume(src: dict, dst: dict, data: tuple) -> dict:
@@ -1149,98 +1001,73 @@ def pair_volume(src: dict, dst: dict, data: tuple) -> dict:
     pairing = get_cluster_pairing(src, dst)
     if not pairing[src['clusterName']
                    ][0]['clusterPairID'] == pairing[src['clusterName']][0]['clusterPairID']:
-        logging.error("Clusters pair IDs do not match. SRC/DST:" +
-                      str(pairing[src['clusterName']][0]['clusterPairID']) +
-                      "," +
-                      str(pairing[dst['clusterName']][0]['clusterPairID']) +
-                      ". Exiting.")
-        exit(200)
+        logging.error("Clusters pair IDs do not match. SRC/DST:%s,%s. Exiting.",
+                      pairing[src['clusterName']][0]['clusterPairID'], pairing[dst['clusterName']][0]['clusterPairID'])
+        raise LonghornyError(200)
     paired_volumes = list_volume(src, dst, [])
     src_volume_ids = [item['localVolumeID'] for item in paired_volumes]
     if len(src_volume_ids) != 0:
-        s_params = {
-            'volumeIDs': src_volume_ids,
-            'isPaired': True,
-            'volumeStatus': 'active',
-            'includeVirtualVolumes': False}
+        s_params = {**PAIRED_VOLUMES, 'volumeIDs': src_volume_ids}
         try:
-            src_vol = src['sfe'].invoke_sfapi(
-                method='ListVolumes', parameters=s_params)['volumes']
-        except BaseException:
+            src_vol = retry_api_call(src['sfe'].invoke_sfapi,
+                                     method='ListVolumes', parameters=s_params)['volumes']
+        except SDK_ERRORS:
             logging.error(
                 "Error getting volume information. Use --list to make sure the volumes exist and SRC and DST are correct. Exiting.")
-            exit(200)
-        src_vol_mode = [v['access'] for v in src_vol]
-        if list(set(src_vol_mode)) != ['readWrite']:
-            logging.error("SRC volume access mode is not suitable for pairing. SRC site volumes are in mode: " +
-                          str(src_vol_mode[0]) +
-                          ". Direction of replication must be from readWrite to replicationTarget. Swap SRC/DST and change volume ID order (SRC first). Exiting.")
+            raise LonghornyError(200)
+        bad_mode = next((v['access'] for v in src_vol
+                         if v['access'] != 'readWrite'), None)
+        if bad_mode is not None:
+            logging.error(
+                "SRC volume access mode is not suitable for pairing. SRC site volumes are in mode: %s. Direction of replication must be from readWrite to replicationTarget. Swap SRC/DST and change volume ID order (SRC first). Exiting.", bad_mode)
 
+    s_params = {**UNPAIRED_VOLUMES,
+                'volumeIDs': [v_pair[0] for v_pair in data]}
+    d_params = {**UNPAIRED_VOLUMES,
+                'volumeIDs': [v_pair[1] for v_pair in data]}
+    try:
+        src_resp, dst_resp = run_on_both_sites(
+            lambda: retry_api_call(src['sfe'].invoke_sfapi,
+                                   method='ListVolumes', parameters=s_params),
+            lambda: retry_api_call(dst['sfe'].invoke_sfapi,
+                                   method='ListVolumes', parameters=d_params))
+    except common.ApiServerError as e:
+        logging.error(
+            "Error getting volume information. Use --list to make sure the volumes exist and SRC and DST are correct. Exiting.")
+        logging.error("Error: %s", e)
+        raise LonghornyError(200)
+    src_by_id = {v['volumeID']: v for v in src_resp['volumes']}
+    dst_by_id = {v['volumeID']: v for v in dst_resp['volumes']}
+    prop_keys = ('blockSize', 'enable512e', 'status', 'totalSize')
     for v_pair in data:
-        s_params = {
-            'volumeIDs': [
-                v_pair[0]],
-            'isPaired': False,
-            'volumeStatus': 'active',
-            'includeVirtualVolumes': False}
-        d_params = {
-            'volumeIDs': [
-                v_pair[1]],
-            'isPaired': False,
-            'volumeStatus': 'active',
-            'includeVirtualVolumes': False}
-        try:
-            src_vol = src['sfe'].invoke_sfapi(
-                method='ListVolumes', parameters=s_params)
-            dst_vol = dst['sfe'].invoke_sfapi(
-                method='ListVolumes', parameters=d_params)
-            if src_vol['volumes'] == [] or dst_vol['volumes'] == []:
-                logging.error(
-                    "Error getting volume information. Use --list to make sure the volumes exist and SRC and DST are correct. Exiting.")
-                exit(200)
-        except common.ApiServerError as e:
+        sv = src_by_id.get(v_pair[0])
+        dv = dst_by_id.get(v_pair[1])
+        if sv is None or dv is None:
             logging.error(
                 "Error getting volume information. Use --list to make sure the volumes exist and SRC and DST are correct. Exiting.")
-            logging.error("Error: " + str(e))
-            exit(200)
-        prop_keys = ['blockSize', 'enable512e', 'status', 'totalSize']
-        if src_vol['volumes'][0]['access'] == 'readWrite' and dst_vol['volumes'][0]['access'] == 'replicationTarget':
+            raise LonghornyError(200)
+        if sv['access'] == 'readWrite' and dv['access'] == 'replicationTarget':
             logging.info(
-                "Volume access mode suitable for SRC and DST volumes:",
-                src_vol['volumes'][0]['access'],
-                dst_vol['volumes'][0]['status'])
-            for k in prop_keys:
-                if src_vol['volumes'][0][k] == dst_vol['volumes'][0][k]:
-                    logging.info("Volume property match for key: " +
-                                 k +
-                                 " SRC: " +
-                                 str(src_vol['volumes'][0][k]) +
-                                 " DST: " +
-                                 str(dst_vol['volumes'][0][k]) +
-                                 ".")
-                else:
-                    logging.error("Volume property mismatch for key: " +
-                                  str(k) +
-                                  ". SRC: " +
-                                  str(src_vol['volumes'][0][k]) +
-                                  " DST: " +
-                                  str(dst_vol['volumes'][0][k]) +
-                                  ". Ensure consistency of settings before pairing. Exiting.")
-                    if k == 'totalSize':
-                        logging.error(
-                            "Volume size mismatch. Enlarge the smaller volume or create a new pair with identical sizes and try again.")
-                    if k == 'enable512e':
-                        logging.error(
-                            "One of the volumes has to be recreated so that both have the same enable512e setting.")
-                    exit(200)
+                "Volume access mode suitable for SRC and DST volumes: %s, %s", sv['access'], dv['access'])
+            mismatch = {k: (sv[k], dv[k])
+                        for k in prop_keys if sv[k] != dv[k]}
+            if mismatch:
+                for k, (s_val, d_val) in mismatch.items():
+                    logging.error("Volume property mismatch for key: %s. SRC: %s DST: %s. Ensure consistency of settings before pairing. Exiting.",
+                                  k, s_val, d_val)
+                if 'totalSize' in mismatch:
+                    logging.error(
+                        "Volume size mismatch. Enlarge the smaller volume or create a new pair with identical sizes and try again.")
+                if 'enable512e' in mismatch:
+                    logging.error(
+                        "One of the volumes has to be recreated so that both have the same enable512e setting.")
+                raise LonghornyError(200)
+            logging.debug("All %d volume properties match for SRC/DST volume IDs: %s/%s.",
+                          len(prop_keys), v_pair[0], v_pair[1])
         else:
-            logging.error(
-                "Volume access mode not suitable (SRC/DST): " +
-                src_vol['volumes'][0]['access'] +
-                " and " +
-                dst_vol['volumes'][0]['access'] +
-                ". Verify direction of cluster replication and set the DST volume ID to reaplicationTarget. Exiting.")
-            exit(200)
+            logging.error("Volume access mode not suitable (SRC/DST): %s and %s. Verify direction of cluster replication and set the DST volume ID to reaplicationTarget. Exiting.",
+                          sv['access'], dv['access'])
+            raise LonghornyError(200)
     for v_pair in data:
         try:
             src_key = src['sfe'].start_volume_pairing(v_pair[0])
@@ -1250,16 +1077,13 @@ def pair_volume(src: dict, dst: dict, data: tuple) -> dict:
             dst['sfe'].invoke_sfapi(
                 method='CompleteVolumePairing',
                 parameters=params)
-            logging.warning("Pairing has been successful. SRC volume ID " +
-                            str(v_pair[0]) +
-                            " has been paired with DST volume ID " +
-                            str(v_pair[1]) +
-                            ".")
+            logging.warning(
+                "Pairing has been successful. SRC volume ID %s has been paired with DST volume ID %s.", v_pair[0], v_pair[1])
         except common.ApiServerError as e:
             logging.error(
                 "Error pairing volumes. SolidFire API returned an error. ")
-            logging.error("Error: " + str(e))
-            exit(200)
+            logging.error("Error: %s", e)
+            raise LonghornyError(200)
     return
 
 
@@ -1270,42 +1094,40 @@ def unpair_volume(src: dict, dst: dict, data: tuple) -> dict:
     Pairing relationship must exist on both sides. If the pair is not symmetric, exit with error.
     """
     paired_volumes = list_volume(src, dst, data)
-    pvt = [((item['localVolumeID'], item['remoteVolumeID']))
-           for item in paired_volumes]
+    pvt = {(item['localVolumeID'], item['remoteVolumeID'])
+           for item in paired_volumes}
     if len(data) == 1 and data[0] in pvt:
         delete_pair = dict(zip(['local', 'remote'], data[0]))
-        if args.dry == True or args.dry == 'True' or args.dry == 'true' or args.dry == 'on' or args.dry == 'On' or args.dry == 'ON':
-            logging.info(
-                "Dry run in unpair action is ON. Value: " + str(args.dry))
+        if args.dry:
+            logging.info("Dry run in unpair action is ON. Value: %s", args.dry)
             print(
                 "\n===> Dry run: replication relationship for volume IDs that would be removed (SRC, DST):",
                 data)
         else:
             logging.warning(
-                "Dry run in unpair action is OFF. Value: " + str(args.dry))
+                "Dry run in unpair action is OFF. Value: %s", args.dry)
             try:
                 src['sfe'].remove_volume_pair(delete_pair['local'])
                 dst['sfe'].remove_volume_pair(delete_pair['remote'])
                 logging.warning(
-                    "Volume IDs unpaired at SRC/DST: " +
-                    str(delete_pair))
+                    "Volume IDs unpaired at SRC/DST: %s", delete_pair)
             except common.ApiServerError as e:
                 logging.error("Error unpairing volumes. Exiting.")
-                logging.error("Error: " + str(e))
-                exit(200)
+                logging.error("Error: %s", e)
+                raise LonghornyError(200)
         return
     elif len(data) > 1 and data[0] in pvt:
         logging.error(
             "More than one volume pair found. That could be risky and is currently not supported. Multiple pairs should be deleted one by one. Exiting.")
-        exit(200)
+        raise LonghornyError(200)
     elif len(data) == 1 or data[0] not in pvt:
         logging.error(
             "Volume pair not found in list of volume replication pairs. Use --list to verify, including SRC and DST settings. Exiting.")
-        exit(200)
+        raise LonghornyError(200)
     else:
         logging.error(
             "Volume pair not found in list of volume replication pairs. Use --list to verify, including SRC and DST settings. Exiting.")
-        exit(200)
+        raise LonghornyError(200)
 
 
 def set_volume_replication_mode(src: dict, dst: dict, replication_mode: list):
@@ -1319,91 +1141,66 @@ def set_volume_replication_mode(src: dict, dst: dict, replication_mode: list):
     """
     if replication_mode[1] == []:
         logging.warning(
-            "No volume IDs provided. All volumes will be set to" +
-            replication_mode[0] +
-            " replication mode.")
-    logging.info("Modify paired volumes to use " +
-                 replication_mode[0] +
-                 " replication mode at SRC. SRC volume IDs: " + str(replication_mode[1]) + ". [] means ALL volumes.")
+            "No volume IDs provided. All volumes will be set to%s replication mode.", replication_mode[0])
+    logging.info("Modify paired volumes to use %s replication mode at SRC. SRC volume IDs: %s. [] means ALL volumes.",
+                 replication_mode[0], replication_mode[1])
     paired_volumes = list_volume(src, dst, [])
     if replication_mode[1] == []:
         src_volume_ids = [item['localVolumeID'] for item in paired_volumes]
     else:
-        src_volume_ids = []
-        for i in replication_mode[1]:
-            if i in [item['localVolumeID'] for item in paired_volumes]:
-                logging.info(
-                    "Volume ID " +
-                    str(i) +
-                    " found in list of currently paired volumes at SRC.")
-                src_volume_ids.append(i)
-            else:
+        paired_ids = frozenset(item['localVolumeID']
+                               for item in paired_volumes)
+        missing = [i for i in replication_mode[1] if i not in paired_ids]
+        if missing:
+            for i in missing:
                 logging.error(
-                    "Volume ID " +
-                    str(i) +
-                    " not found in list of currently paired volumes at SRC. Are you sure you got the right site or paired volume IDs? Exiting.")
-                exit(200)
-    s_params = {
-        'volumeIDs': src_volume_ids,
-        'isPaired': True,
-        'volumeStatus': 'active',
-        'includeVirtualVolumes': False}
+                    "Volume ID %s not found in list of currently paired volumes at SRC. Are you sure you got the right site or paired volume IDs? Exiting.", i)
+            raise LonghornyError(200)
+        src_volume_ids = list(replication_mode[1])
+        logging.info(
+            "Volume IDs %s found in list of currently paired volumes at SRC.", src_volume_ids)
+    s_params = {**PAIRED_VOLUMES, 'volumeIDs': src_volume_ids}
     try:
-        src_vol = src['sfe'].invoke_sfapi(
-            method='ListVolumes', parameters=s_params)['volumes']
+        src_vol = retry_api_call(src['sfe'].invoke_sfapi,
+                                 method='ListVolumes', parameters=s_params)['volumes']
         if src_vol == []:
             logging.error(
                 "Error getting volume information. Use --list to make sure the volumes exist and SRC and DST are correct. Exiting.")
-            exit(200)
+            raise LonghornyError(200)
     except common.ApiServerError as e:
         logging.error(
             "Error getting volume information. Use --list to make sure the volumes exist and SRC and DST are correct. Exiting.")
-        logging.error("Error: " + str(e))
-        exit(200)
-    src_vol_mode = [v['access'] for v in src_vol]
-    if list(set(src_vol_mode)) != ['readWrite']:
-        logging.error("SRC volume access mode is not suitable for pairing. Specified SRC site volumes are in mode: " +
-                      str(src_vol_mode[0]) +
-                      ". Direction of replication must be from readWrite to replicationTarget. Changes must be made on the source where replication originates. Maybe you tried to change mode at DST? Exiting.")
-        exit(200)
-    if args.dry == True or args.dry == 'True' or args.dry == 'true' or args.dry == 'on' or args.dry == 'On' or args.dry == 'ON':
+        logging.error("Error: %s", e)
+        raise LonghornyError(200)
+    bad_mode = next((v['access'] for v in src_vol
+                     if v['access'] != 'readWrite'), None)
+    if bad_mode is not None:
+        logging.error(
+            "SRC volume access mode is not suitable for pairing. Specified SRC site volumes are in mode: %s. Direction of replication must be from readWrite to replicationTarget. Changes must be made on the source where replication originates. Maybe you tried to change mode at DST? Exiting.", bad_mode)
+        raise LonghornyError(200)
+    if args.dry:
         logging.info(
-            "Dry run on replication mode change is ON. Value: " + str(args.dry))
+            "Dry run on replication mode change is ON. Value: %s", args.dry)
         print("\n===> Dry run: Replication mode of SRC volume IDs that would be changed to " +
               replication_mode[0] + " : " + str(src_volume_ids) + ".")
-        logging.info(
-            "DRY RUN on replication mode change for volumes at SRC. No changes will be made. Action would change SRC volume ID(s) " +
-            str(src_volume_ids) +
-            " to " +
-            str(replication_mode[1]) +
-            " while no changes would be done to DST volumes.")
+        logging.info("DRY RUN on replication mode change for volumes at SRC. No changes will be made. Action would change SRC volume ID(s) %s to %s while no changes would be done to DST volumes.",
+                     src_volume_ids, replication_mode[1])
     else:
         logging.warning(
-            "Dry run on replication mode change for volumes at SRC is OFF. Value: " +
-            str(
-                args.dry) +
-            ". Setting replication mode  to " +
-            str(replication_mode[0]) +
-            ".")
-        for vid in src_volume_ids:
-            try:
-                src['sfe'].modify_volume_pair(
-                    vid, mode=replication_mode[0])
-                logging.info(
-                    "Set replication mode on SRC volume " +
-                    str(vid) +
-                    " to " +
-                    str(replication_mode[0]) +
-                    ".")
-            except common.ApiServerError as e:
-                logging.error(
-                    "Error setting replication status on SRC volume " +
-                    str(vid) +
-                    " to " +
-                    str(replication_mode[0]) +
-                    ". Exiting.")
-                logging.error("Error: " + str(e))
-                exit(200)
+            "Dry run on replication mode change for volumes at SRC is OFF. Value: %s. Setting replication mode  to %s.", args.dry, replication_mode[0])
+
+        def set_mode(vid):
+            retry_api_call(src['sfe'].modify_volume_pair,
+                           vid, mode=replication_mode[0])
+            logging.info(
+                "Set replication mode on SRC volume %s to %s.", vid, replication_mode[0])
+
+        failed = run_for_each(set_mode, src_volume_ids)
+        if failed:
+            logging.error(
+                "Error setting replication status on SRC volume %s to %s. Exiting.", failed[0], replication_mode[0])
+            logging.error("Error: %s", failed[1])
+            raise LonghornyError(200)
 
     return
 
@@ -1421,50 +1218,34 @@ def set_volume_replication_state(
         pause_replication = False
     else:
         logging.error("Invalid desired replication state proposed. Exiting.")
-        exit(200)
+        raise LonghornyError(200)
     paired_volumes = list_volume(src, dst, [])
-    if len(paired_volumes) == 0 or paired_volumes is None or paired_volumes == []:
+    if not paired_volumes:
         logging.error("No paired volumes found. Exiting.")
-        exit(200)
+        raise LonghornyError(200)
     src_volume_ids = [item['localVolumeID'] for item in paired_volumes]
-    if args.dry == True or args.dry == 'True' or args.dry == 'true' or args.dry == 'on' or args.dry == 'On' or args.dry == 'ON':
+    if args.dry:
         logging.info(
-            "Dry run on replication status change is ON. Value: " + str(args.dry))
+            "Dry run on replication status change is ON. Value: %s", args.dry)
         print("\n===> Dry run: SRC volume IDs that would be changed to " +
               replication_status + " : " + str(src_volume_ids) + ".")
-        logging.info(
-            "DRY RUN on access property change for volumes at SRC. No changes will be made. Action would change SRC volume ID(s) " +
-            str(src_volume_ids) +
-            " to " +
-            str(replication_status) +
-            " and ignore mode of DST volumes.")
+        logging.info("DRY RUN on access property change for volumes at SRC. No changes will be made. Action would change SRC volume ID(s) %s to %s and ignore mode of DST volumes.", src_volume_ids, replication_status)
     else:
         logging.warning(
-            "Dry run on replication state change for volumes at SRC is OFF. Value: " +
-            str(
-                args.dry) +
-            ". Setting paused_manual to " +
-            str(pause_replication) +
-            ".")
-        for vid in src_volume_ids:
-            try:
-                src['sfe'].modify_volume_pair(
-                    vid, paused_manual=pause_replication)
-                logging.info(
-                    "Set replication status on SRC volume " +
-                    str(vid) +
-                    " to " +
-                    str(replication_status) +
-                    ".")
-            except common.ApiServerError as e:
-                logging.error(
-                    "Error setting replication status on SRC volume " +
-                    str(vid) +
-                    " to " +
-                    str(replication_status) +
-                    ". Exiting.")
-                logging.error("Error: " + str(e))
-                exit(200)
+            "Dry run on replication state change for volumes at SRC is OFF. Value: %s. Setting paused_manual to %s.", args.dry, pause_replication)
+
+        def set_state(vid):
+            retry_api_call(src['sfe'].modify_volume_pair,
+                           vid, paused_manual=pause_replication)
+            logging.info(
+                "Set replication status on SRC volume %s to %s.", vid, replication_status)
+
+        failed = run_for_each(set_state, src_volume_ids)
+        if failed:
+            logging.error(
+                "Error setting replication status on SRC volume %s to %s. Exiting.", failed[0], replication_status)
+            logging.error("Error: %s", failed[1])
+            raise LonghornyError(200)
     return
 
 
@@ -1475,176 +1256,88 @@ def reverse_replication(src: dict, dst: dict) -> dict:
     Pausing / Resuming Volume replication manually causes the transmission of data to cease or resume.
     Changing access mode of replication causes the mode to change direction.
     """
-    cluster_pair_name_id = src['sfe'].list_cluster_pairs().to_json()[
-        'clusterPairs']
-    if len(cluster_pair_name_id) != 1:
-        for i in cluster_pair_name_id:
-            logging.warning("Reviewing cluster pair ID: " +
-                            str(i['clusterPairID']))
-            if i['clusterName'] != dst['clusterName']:
-                logging.error(
-                    "Found Unconfigured cluster pairing or other pairing with another cluster on cluster " +
-                    str(
-                        src['clusterName']) +
-                    ". Exiting.")
-                exit(200)
-            else:
-                continue
-
+    src_pairs = get_cluster_pairing(src, dst)[src['clusterName']]
+    if len(src_pairs) != 1:
+        foreign = next(
+            (i for i in src_pairs if i['clusterName'] != dst['clusterName']), None)
+        if foreign is not None:
+            logging.error(
+                "Found Unconfigured cluster pairing or other pairing with another cluster on cluster %s (cluster pair ID %s). Exiting.", src['clusterName'], foreign['clusterPairID'])
+            raise LonghornyError(200)
     else:
-        logging.info("Cluster pair ID should be DST cluster MVIP: " +
-                     str(dst['mvip']) +
-                     ". DST cluster MVIP of paired cluster is:" +
-                     str(cluster_pair_name_id[0]['mvip']) +
-                     " and pair ID against which we will verify is: " +
-                     str(cluster_pair_name_id[0]['clusterPairID']) +
-                     ".")
-    paired_volumes = list_volume(src, dst, [])
-    if len(paired_volumes) == 0 or paired_volumes is None or paired_volumes == []:
-        logging.error("No paired volumes found. Exiting.")
-        exit(200)
-    src_volume_ids = [item['localVolumeID'] for item in paired_volumes]
-    dst_volume_ids = [item['remoteVolumeID'] for item in paired_volumes]
-    s_params = {
-        'volumeIDs': src_volume_ids,
-        'isPaired': True,
-        'volumeStatus': 'active',
-        'includeVirtualVolumes': False}
-    d_params = {
-        'volumeIDs': dst_volume_ids,
-        'isPaired': True,
-        'volumeStatus': 'active',
-        'includeVirtualVolumes': False}
+        logging.info("Cluster pair ID should be DST cluster MVIP: %s. DST cluster MVIP of paired cluster is:%s and pair ID against which we will verify is: %s.",
+                     dst['mvip'], src_pairs[0]['mvip'], src_pairs[0]['clusterPairID'])
+    # Paired volumes on both sites are listed in one concurrent round trip;
+    # the SRC list is validated and provides the volume IDs and access modes
     try:
-        src_vol = src['sfe'].invoke_sfapi(
-            method='ListVolumes', parameters=s_params)['volumes']
-        dst_vol = dst['sfe'].invoke_sfapi(
-            method='ListVolumes', parameters=d_params)['volumes']
-        if src_vol == [] or dst_vol == []:
-            logging.error(
-                "Error getting volume information. Use --list to make sure the volumes exist and SRC and DST are correct. Exiting.")
-            exit(200)
+        src_resp, dst_resp = run_on_both_sites(
+            lambda: retry_api_call(src['sfe'].invoke_sfapi,
+                                   method='ListVolumes', parameters=PAIRED_VOLUMES),
+            lambda: retry_api_call(dst['sfe'].invoke_sfapi,
+                                   method='ListVolumes', parameters=PAIRED_VOLUMES))
     except common.ApiServerError as e:
         logging.error(
             "Error getting volume information. Use --list to make sure the volumes exist and SRC and DST are correct. Exiting.")
-        logging.error("Error: " + str(e))
-        exit(200)
+        logging.error("Error: %s", e)
+        raise LonghornyError(200)
+    paired_volumes = list_volume(src, dst, [], src_volumes=src_resp['volumes'])
+    if not paired_volumes:
+        logging.error("No paired volumes found. Exiting.")
+        raise LonghornyError(200)
+    src_volume_ids, dst_volume_ids = paired_volume_ids(paired_volumes)
+    src_id_set = set(src_volume_ids)
+    dst_id_set = set(dst_volume_ids)
+    src_vol = [v for v in src_resp['volumes'] if v['volumeID'] in src_id_set]
+    dst_vol = [v for v in dst_resp['volumes'] if v['volumeID'] in dst_id_set]
+    if not src_vol or not dst_vol:
+        logging.error(
+            "Error getting volume information. Use --list to make sure the volumes exist and SRC and DST are correct. Exiting.")
+        raise LonghornyError(200)
     s = 15  # 15 seconds grace period before action
-    if list(set([v['access'] for v in src_vol])) == ['replicationTarget'] and list(
-            set([v['access'] for v in dst_vol])) == ['readWrite']:
+    src_modes = frozenset(v['access'] for v in src_vol)
+    dst_modes = frozenset(v['access'] for v in dst_vol)
+    if src_modes == {'replicationTarget'} and dst_modes == {'readWrite'}:
         logging.warning(
-            "SRC is currently replicationTarget, DST is currently readWrite. Will reverse direction to make SRC readWrite and DST replicationTarget in " +
-            str(s) +
-            " seconds.")
+            "SRC is currently replicationTarget, DST is currently readWrite. Will reverse direction to make SRC readWrite and DST replicationTarget in %s seconds.", s)
         reverse_src_mode = 'readWrite'
         reverse_dst_mode = 'replicationTarget'
-        logging.info(
-            "All SRC and DST volumes are in consistent access mode. SRC: " +
-            str(src_vol) +
-            " DST: " +
-            str(dst_vol) +
-            ". Proceeding with reversal in " +
-            str(s) +
-            " seconds. Press CTRL+C to abort.")
+        logging.info("All SRC and DST volumes are in consistent access mode. SRC: %s DST: %s. Proceeding with reversal in %s seconds. Press CTRL+C to abort.", src_vol, dst_vol, s)
         countdown(s)
-    elif list(set([v['access'] for v in src_vol])) == ['readWrite'] and list(set([v['access'] for v in dst_vol])) == ['replicationTarget']:
+    elif src_modes == {'readWrite'} and dst_modes == {'replicationTarget'}:
         logging.warning(
-            "SRC is currently readWrite, DST is currently replicationTarget. Will reverse direction to make SRC replicationTarget and DST readWrite in " +
-            str(s) +
-            " seconds.")
+            "SRC is currently readWrite, DST is currently replicationTarget. Will reverse direction to make SRC replicationTarget and DST readWrite in %s seconds.", s)
         reverse_src_mode = 'replicationTarget'
         reverse_dst_mode = 'readWrite'
-        logging.info(
-            "All SRC and DST volumes are in consistent access mode. SRC: " +
-            str(src_vol) +
-            " DST: " +
-            str(dst_vol) +
-            ". Proceeding with reversal in " +
-            str(s) +
-            " seconds. Press CTRL+C to abort.")
+        logging.info("All SRC and DST volumes are in consistent access mode. SRC: %s DST: %s. Proceeding with reversal in %s seconds. Press CTRL+C to abort.", src_vol, dst_vol, s)
         countdown(s)
     else:
-        logging.error("SRC and DST volumes are not in expected mode. SRC: " +
-                      str(list(set([v['access'] for v in src_vol]))[0]) +
-                      " DST: " +
-                      str(list(set([v['access'] for v in dst_vol]))[0]) +
-                      ". Exiting.")
-        exit(200)
-    if args.dry == True or args.dry == 'True' or args.dry == 'true' or args.dry == 'on' or args.dry == 'On' or args.dry == 'ON':
+        logging.error("SRC and DST volumes are not in expected mode. SRC: %s DST: %s. Exiting.",
+                      sorted(src_modes), sorted(dst_modes))
+        raise LonghornyError(200)
+    if args.dry:
         logging.info(
-            "Dry run on reversal of replication direction is ON. Value: " + str(args.dry) + ".")
+            "Dry run on reversal of replication direction is ON. Value: %s.", args.dry)
         print("\n===> Dry run: volume IDs that would be changed to " +
               reverse_src_mode + " at SRC:", src_volume_ids)
         print("\n===> Dry run: volume IDs that would be changed to " +
               reverse_dst_mode + " at DST:", dst_volume_ids)
-        logging.info(
-            "DRY RUN on access mode reversal for volume pairs. No changes will be made. Action would change SRC volume ID(s) " +
-            str(src_volume_ids) +
-            " to " +
-            str(reverse_src_mode) +
-            " and DST volume ID(s) " +
-            str(dst_volume_ids) +
-            " to " +
-            str(reverse_dst_mode) +
-            ".")
+        logging.info("DRY RUN on access mode reversal for volume pairs. No changes will be made. Action would change SRC volume ID(s) %s to %s and DST volume ID(s) %s to %s.",
+                     src_volume_ids, reverse_src_mode, dst_volume_ids, reverse_dst_mode)
     else:
         logging.warning(
-            "Dry run on reversal of replication direction is OFF. Value: " + str(args.dry) + ".")
-        if len(paired_volumes) < 500:
-            try:
-                src['sfe'].modify_volumes(
-                    src_volume_ids, access=reverse_src_mode)
-                dst['sfe'].modify_volumes(
-                    dst_volume_ids, access=reverse_dst_mode)
-                logging.info(
-                    "Reversed access mode on SRC and DST. SRC Volume IDs: " +
-                    str(src_volume_ids) +
-                    ".")
-            except common.ApiServerError as e:
-                logging.error(
-                    "Failed to reverse volume access mode on SRC and DST volumes. Please check and remedy. Exiting.")
-                logging.error("Error: " + str(e))
-                exit(200)
-        else:
-            logging.warning(
-                "Many volumes found, pause, reversal and resume will be done one by one. Volume count: " +
-                str(
-                    len(paired_volumes)) +
-                ".")
-            for item in paired_volumes:
-                try:
-                    dst['sfe'].modify_volume_pair(
-                        item['remoteVolumeID'], paused_manual=True)
-                    src['sfe'].modify_volume_pair(
-                        item['localVolumeID'], paused_manual=True)
-                    logging.info("Paused replication on SRC volume ID: " +
-                                 str(item['localVolumeID']) +
-                                 " and DST volume ID: " +
-                                 str(item['remoteVolumeID']) +
-                                 ".")
-                    dst['sfe'].modify_volume(
-                        item['remoteVolumeID'], access=reverse_dst_mode)
-                    src['sfe'].modify_volume(
-                        item['localVolumeID'], access=reverse_src_mode)
-                    logging.info("Reversed access mode on SRC volume ID: " +
-                                 str(item['localVolumeID']) +
-                                 " and DST volume ID: " +
-                                 str(item['remoteVolumeID']) +
-                                 ".")
-                    dst['sfe'].modify_volume_pair(
-                        item['remoteVolumeID'], paused_manual=False)
-                    src['sfe'].modify_volume_pair(
-                        item['localVolumeID'], paused_manual=False)
-                    logging.info("Unpaused replication on SRC volume ID: " +
-                                 str(item['localVolumeID']) +
-                                 " and DST volume ID: " +
-                                 str(item['remoteVolumeID']) +
-                                 ".")
-                except common.ApiServerError as e:
-                    logging.error(
-                        "Failed to reverse volume access mode on SRC and DST volumes. Please check and remedy. Exiting.")
-                    logging.error("Error: " + str(e))
-                    exit(200)
+            "Dry run on reversal of replication direction is OFF. Value: %s.", args.dry)
+        try:
+            bulk_modify_volumes(src['sfe'], src_volume_ids,
+                                access=reverse_src_mode)
+            bulk_modify_volumes(dst['sfe'], dst_volume_ids,
+                                access=reverse_dst_mode)
+            logging.info(
+                "Reversed access mode on SRC and DST. SRC Volume IDs: %s.", src_volume_ids)
+        except common.ApiServerError as e:
+            logging.error(
+                "Failed to reverse volume access mode on SRC and DST volumes. Please check and remedy. Exiting.")
+            logging.error("Error: %s", e)
+            raise LonghornyError(200)
     return
 
 
@@ -1658,13 +1351,14 @@ def site(args):
         if args.data is None:
             logging.error(
                 "Access mode must be specified. Use --data 'readWrite' or --data 'replicationTarget'. Exiting.")
-            exit(300)
+            raise LonghornyError(300)
         else:
             volume_access_property = access_type(args.data)
         if access_type == 'readWrite':
-            logging.info("Desired access mode: " + volume_access_property)
+            logging.info("Desired access mode: %s", volume_access_property)
         elif access_type == 'replicationTarget':
-            logging.info("Desired access mode: " + volume_access_property)
+            logging.info("Desired access mode: %s", volume_access_property)
+        connect_sites(src, dst, args.no_cache)
         set_site_volume_access_property(src, dst, volume_access_property)
     else:
         logging.warning("Site action not recognized")
@@ -1688,222 +1382,565 @@ def set_site_volume_access_property(src: dict, dst: dict, mode: str):
     Makes no changes on DST cluster. Use volume --reverse to reverse direction of replication (i.e. change mode on both sites).
     """
     paired_volumes = list_volume(src, dst, [])
-    if len(paired_volumes) == 0 or paired_volumes is None or paired_volumes == []:
+    if not paired_volumes:
         logging.error("No paired volumes found. Exiting.")
-        exit(300)
+        raise LonghornyError(300)
     src_volume_ids = [item['localVolumeID'] for item in paired_volumes]
-    if args.dry == True or args.dry == 'True' or args.dry == 'true' or args.dry == 'on' or args.dry == 'On' or args.dry == 'ON':
+    if args.dry:
         logging.info(
-            "Dry run on unilateral access property change is ON. Value: " + str(args.dry))
+            "Dry run on unilateral access property change is ON. Value: %s", args.dry)
         print(
             "\n===> Dry run: SRC volume IDs that would be changed to " +
             mode +
             " : " +
             str(src_volume_ids) +
             ".")
-        logging.info(
-            "DRY RUN on unilateral access property change for volumes at SRC. No changes will be made. Action would change SRC volume ID(s) " +
-            str(src_volume_ids) +
-            " to " +
-            str(mode) +
-            " and ignore mode of DST volumes.")
+        logging.info("DRY RUN on unilateral access property change for volumes at SRC. No changes will be made. Action would change SRC volume ID(s) %s to %s and ignore mode of DST volumes.", src_volume_ids, mode)
     else:
         logging.warning(
-            "Dry run on unilateral access property change for volumes at SRC is OFF. Value: " +
-            str(
-                args.dry) +
-            ".")
-        if len(src_volume_ids) < 500:
-            try:
-                src['sfe'].modify_volumes(src_volume_ids, access=mode)
-                logging.info(
-                    "Set volume access mode on SRC volumes " +
-                    str(src_volume_ids) +
-                    " to " +
-                    str(mode) +
-                    ".")
-            except BaseException:
-                logging.error(
-                    "Error modifying volume access mode on SRC volumes. This causes mismatch and may prevent storage access on one or more volumes. Exiting.")
-                exit(300)
-        else:
-            logging.warning(
-                "Over 500 volumes found. Pause, reversal and resume will be done one by one. Volume count: " +
-                str(
-                    len(src_volume_ids)) +
-                ".")
-            for item in src_volume_ids:
+            "Dry run on unilateral access property change for volumes at SRC is OFF. Value: %s.", args.dry)
+        try:
+            bulk_modify_volumes(src['sfe'], src_volume_ids, access=mode)
+            logging.info(
+                "Set volume access mode on SRC volumes %s to %s.", src_volume_ids, mode)
+        except SDK_ERRORS:
+            logging.error(
+                "Error modifying volume access mode on SRC volumes. This causes mismatch and may prevent storage access on one or more volumes. Exiting.")
+            raise LonghornyError(300)
+    return
+
+
+def connect_sites(src: dict, dst: dict, no_cache: bool = False):
+    """
+    Log in to SRC and DST and add 'sfe' (SolidFire SDK session) and 'clusterName' to each site dict.
+
+    Called by actions that need both clusters, so that parser errors and local actions do not connect at all.
+    Sessions are kept in sessions by (MVIP, username) and reused if called again.
+    SRC and DST are connected to concurrently, so start-up waits for the slower cluster rather than both.
+    Cluster names are cached between runs unless no_cache is True.
+    """
+    def login(site: dict):
+        key = (site['mvip'], site['username'])
+        if key not in sessions:
+            sfe = ElementFactory.create(
+                site['mvip'],
+                site['username'],
+                site['password'],
+                verify_ssl=site['tlsv'],
+                print_ascii_art=False)
+            pool_connections(sfe)
+            sessions[key] = {'sfe': sfe}
+        site['sfe'] = sessions[key]['sfe']
+
+    def get_cluster_name(site: dict):
+        session = sessions[(site['mvip'], site['username'])]
+        if 'clusterName' not in session:
+            name = None if no_cache else read_cached_cluster_name(
+                site['mvip'])
+            if name is None:
                 try:
-                    src['sfe'].modify_volume(item, access=mode)
-                    logging.info(
-                        "Set volume access on SRC volume ID: " +
-                        str(item) +
-                        " to " +
-                        str(mode) +
-                        ".")
-                except BaseException:
-                    logging.error(
-                        "Error modifying volume access mode on SRC volume ID: " +
-                        str(item) +
-                        ". This causes mismatch and may prevent storage access on one or more volumes. Exiting.")
-                    exit(300)
+                    name = retry_api_call(
+                        site['sfe'].invoke_sfapi, 'GetClusterInfo', {})['clusterInfo']['name']
+                except SDK_ERRORS:
+                    name = None if no_cache else read_cached_cluster_name(
+                        site['mvip'], stale=True)
+                    if name is None:
+                        raise
+                    logging.warning(
+                        "Unable to get cluster info from %s. Using cached cluster name %s.", site['mvip'], name)
+                else:
+                    if not no_cache:
+                        write_cached_cluster_name(site['mvip'], name)
+            session['clusterName'] = name
+        site['clusterName'] = session['clusterName']
+
+    def connect(site: dict):
+        try:
+            login(site)
+        except Exception as e:
+            logging.error("Error: %s", e)
+            raise LonghornyError(2)
+        try:
+            get_cluster_name(site)
+        except common.ApiServerError as e:
+            logging.error("Error: %s", e)
+            raise LonghornyError(3)
+        except Exception as e:
+            logging.error(
+                "Error, possibly due to one or both clusters being unreachable: %s", e)
+            raise LonghornyError(3)
+
+    run_on_both_sites(lambda: connect(src), lambda: connect(dst))
+    logging.info("SRC cluster name: %s and DST cluster name: %s obtained.",
+                 src['clusterName'], dst['clusterName'])
+    return
+
+
+def cluster_name_cache_dir() -> str:
+    """
+    Return the per-user directory for cached cluster names ($XDG_CACHE_HOME/longhorny or ~/.cache/longhorny), creating it with mode 0700.
+
+    Raises OSError if the directory cannot be created or is not a directory owned by the current user.
+    """
+    path = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(
+        os.path.join('~', '.cache')), 'longhorny')
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode) or not owned_by_current_user(st):
+        raise OSError("not a directory owned by the current user: " + path)
+    return path
+
+
+def owned_by_current_user(st: os.stat_result) -> bool:
+    """
+    Return True if the file described by st belongs to the current user. Always True where the OS has no user IDs.
+    """
+    return not hasattr(os, 'getuid') or st.st_uid == os.getuid()
+
+
+def cluster_name_cache_path(mvip: str) -> str:
+    """
+    Return the path of the file that caches the cluster name of MVIP.
+    """
+    return os.path.join(cluster_name_cache_dir(),
+                        re.sub(r'[^\w.-]', '_', mvip) + '.json')
+
+
+def read_cached_cluster_name(mvip: str, stale: bool = False) -> str:
+    """
+    Return the cluster name cached for MVIP, or None if there is no usable cache file or it is older than CLUSTER_NAME_CACHE_TTL.
+
+    Use stale=True to accept a name up to CLUSTER_NAME_CACHE_MAX_AGE old, for when the cluster does not respond.
+    Cache files that are not regular files owned by the current user are ignored.
+    """
+    max_age = CLUSTER_NAME_CACHE_MAX_AGE if stale else CLUSTER_NAME_CACHE_TTL
+    try:
+        path = cluster_name_cache_path(mvip)
+        st = os.lstat(path)
+        if not stat.S_ISREG(st.st_mode) or not owned_by_current_user(st):
+            logging.warning(
+                "Ignoring cluster name cache file %s not owned by the current user.", path)
+            return None
+        if time.time() - st.st_mtime > max_age:
+            return None
+        with open(path) as f:
+            return json.load(f)['clusterName']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def write_cached_cluster_name(mvip: str, name: str):
+    """
+    Cache the cluster name of MVIP for later runs. Failure to write the cache file is logged and otherwise ignored.
+
+    The file is written to a private temporary file (mode 0600) in the cache directory and then renamed into place.
+    """
+    try:
+        path = cluster_name_cache_path(mvip)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'mvip': mvip, 'clusterName': name}, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logging.info("Unable to cache cluster name for %s: %s", mvip, e)
+    return
+
+
+@functools.lru_cache(maxsize=1)
+def http_session():
+    """
+    Return the requests session shared by the SRC and DST SDK clients, created on first use.
+
+    Connections are pooled per host, and TCP keepalive is enabled so that idle pooled connections are not silently dropped between API calls.
+    """
+
+    class KeepAliveAdapter(HTTPAdapter):
+        def init_poolmanager(self, *pool_args, **pool_kwargs):
+            pool_kwargs.setdefault('socket_options', HTTPConnection.default_socket_options + [
+                                   (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)])
+            super().init_poolmanager(*pool_args, **pool_kwargs)
+
+    session = requests.Session()
+    adapter = KeepAliveAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=0)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def pool_connections(sfe):
+    """
+    Make the SolidFire SDK reuse HTTPS connections to the MVIP between API calls, using the session from http_session().
+
+    The SDK's default dispatcher calls requests.post() which sets up a new TCP and TLS connection for every API call, and offers no way to pass a session.
+    This is the only place Longhorny relies on SDK internals: it replaces the post method of the private sfe._dispatcher (solidfire.common.CurlDispatcher)
+    with one that sends the same request with the same credentials, TLS verification and timeout through the shared session.
+    """
+    dispatcher = sfe._dispatcher
+    session = http_session()
+
+    def post(data):
+        if dispatcher._username is None or dispatcher._password is None:
+            raise ValueError("Username or Password is not set")
+        resp = session.post(
+            dispatcher._endpoint,
+            data=data,
+            json=None,
+            verify=dispatcher._verify_ssl,
+            timeout=dispatcher._timeout,
+            auth=requests.auth.HTTPBasicAuth(
+                dispatcher._username,
+                dispatcher._password))
+        if resp.text == '':
+            return {"code": resp.status_code,
+                    "name": resp.reason, "message": ""}
+        return resp.text
+    dispatcher.post = post
+    return
+
+
+def run_on_both_sites(src_call, dst_call) -> tuple:
+    """
+    Run two independent API calls against SRC and DST concurrently and return their results as (SRC, DST).
+
+    Exceptions raised by either call are re-raised to the caller, so existing error handling around the calls still applies.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        src_future = executor.submit(src_call)
+        dst_future = executor.submit(dst_call)
+        return src_future.result(), dst_future.result()
+
+
+def bulk_modify_volumes(sfe, volume_ids: list, **kwargs):
+    """
+    Apply the same ModifyVolumes change to any number of volumes, MODIFY_VOLUMES_LIMIT volumes per API call.
+
+    API errors are raised to the caller. Volumes in earlier batches have already been modified at that point.
+    """
+    for i in range(0, len(volume_ids), MODIFY_VOLUMES_LIMIT):
+        retry_api_call(sfe.modify_volumes,
+                       volume_ids[i:i + MODIFY_VOLUMES_LIMIT], **kwargs)
+    return
+
+
+def run_for_each(fn, items: list, max_workers: int = 8):
+    """
+    Call fn(item) concurrently for each item, for independent per-volume API calls that have no bulk equivalent.
+
+    Stops submitting work at the first ApiServerError and returns (item, error) for it, or None if all calls succeeded.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fn, item): item for item in items}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except ApiServerError as e:
+                for f in futures:
+                    f.cancel()
+                return futures[future], e
+    return None
+
+
+def is_transient_api_error(e: Exception) -> bool:
+    """
+    Return True if SolidFire API error e is likely to go away if the same request is retried.
+
+    The SDK also raises ApiConnectionError for permanent failures such as bad credentials, 404 or a cluster method called on a node,
+    so those are recognized by their message and not retried.
+    """
+    if isinstance(e, common.ApiConnectionError):
+        return not any(m in str(e) for m in PERMANENT_CONNECTION_ERRORS)
+    if isinstance(e, common.ApiServerError):
+        return e.error_name in RETRYABLE_API_ERRORS or e.error_code in RETRYABLE_HTTP_CODES
+    return False
+
+
+def retry_api_call(fn, *fn_args, max_retries: int = None, **fn_kwargs):
+    """
+    Call SolidFire API method fn and retry transient failures with capped exponential backoff and full jitter.
+
+    Connection errors, cluster busy errors (e.g. xDBConnectionLoss, xNotReadyForIO) and HTTP 429/5xx are retried up to max_retries times
+    (default: api_max_retries, which the CLI sets from --max-retries).
+    Other errors such as invalid parameters or bad credentials are raised immediately, as is the last error when retries are exhausted.
+    Use only for read-only or idempotent calls: a retried request may have been executed by the cluster before the connection failed.
+    """
+    if max_retries is None:
+        max_retries = api_max_retries
+    max_retries = max(0, max_retries)
+    attempt = 0
+    while True:
+        try:
+            return fn(*fn_args, **fn_kwargs)
+        except (common.ApiServerError, common.ApiConnectionError) as e:
+            if attempt >= max_retries or not is_transient_api_error(e):
+                raise
+            delay = random.uniform(
+                0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+            logging.warning("Transient API error in %s (attempt %s of %s). Retrying in %.2f seconds. Error: %s",
+                            getattr(fn, '__name__', fn), attempt + 1, max_retries + 1, delay, e)
+            time.sleep(delay)
+            attempt += 1
+
+
+def print_report(report):
+    """
+    Print a report in the format selected with --output.
+
+    With --output auto, pretty-print on a terminal and write compact one-line JSON when stdout is redirected.
+    """
+    if args.output == 'json':
+        print(json.dumps(report, indent=2, default=str))
+    elif args.output == 'pretty' or sys.stdout.isatty():
+        pprint.pp(report)
+    else:
+        print(json.dumps(report, default=str))
     return
 
 
 def countdown(s: int):
     """
-    Countdown timer for s seconds.
+    Wait s seconds before proceeding, giving the user a chance to abort with CTRL+C.
     """
-    for i in range(s, 0, -1):
-        print(i)
-        time.sleep(1)
+    print("Proceeding in %s seconds. Press CTRL+C to abort." % s, flush=True)
+    try:
+        time.sleep(s)
+    except KeyboardInterrupt:
+        logging.warning("Aborted by user. No changes have been made.")
+        raise LonghornyError(200)
     return
 
 
+def on_off_type(s) -> bool:
+    """
+    Parse an on/off option value such as --dry or --tlsv once at argument parsing time.
+
+    'on', 'true', 't', 'yes', 'y' and '1' are True and 'off', 'false', 'f', 'no', 'n' and '0' are False (any case, surrounding whitespace ignored).
+    Anything else is rejected, so that a typo cannot silently turn an option off.
+    """
+    value = str(s).strip().lower()
+    if value in ('on', 'true', 't', 'yes', 'y', '1'):
+        return True
+    if value in ('off', 'false', 'f', 'no', 'n', '0'):
+        return False
+    raise argparse.ArgumentTypeError(
+        "expected on or off (or 1 or 0), not %r" % s)
+
+
+def non_negative_int(s) -> int:
+    """
+    Parse a count option value such as --max-retries at argument parsing time. Rejects anything that is not an integer of 0 or more.
+    """
+    try:
+        value = int(s)
+    except ValueError:
+        value = -1
+    if value < 0:
+        raise argparse.ArgumentTypeError(
+            "expected an integer of 0 or more, not %r" % s)
+    return value
+
+
+def int_list(s: str) -> list:
+    """
+    Parse a comma-separated list of integers such as '1,51' with a precompiled pattern. Raises ValueError if s is not such a list.
+    """
+    if not INT_LIST_RE.fullmatch(s):
+        raise ValueError("not a comma-separated list of integers: %r" % s)
+    return [int(i) for i in INT_RE.findall(s)]
+
+
+def site_data(s: str) -> dict:
+    """
+    Parse a --src or --dst site string into a dict with mvip, username and password.
+
+    Takes 'mvip=10.1.1.1;username=admin;password=' or the dictionary form "{ 'mvip': '10.1.1.1', 'username':'admin', 'password':''}".
+    Only the dictionary form needs the ast module, so it is imported just for that case. The password is taken as given, including any spaces.
+    Raises ValueError on bad input or when mvip or username is missing.
+    """
+    if s.lstrip().startswith('{'):
+        import ast
+        try:
+            site = ast.literal_eval(s.strip())
+        except SyntaxError as e:
+            raise ValueError(e)
+        if not isinstance(site, dict):
+            raise ValueError("Site must be a dictionary.")
+    else:
+        site = {}
+        for item in s.split(';'):
+            key, sep, value = item.partition('=')
+            if not sep:
+                raise ValueError("Site item must be key=value: " + item)
+            key = key.strip()
+            site[key] = value if key == 'password' else value.strip()
+    if 'mvip' not in site or 'username' not in site:
+        raise ValueError("Site requires mvip and username.")
+    site.setdefault('password', '')
+    return site
+
+
+def site_password(site_name: str, site: dict) -> str:
+    """
+    Return the password for a site given without one.
+
+    Tries, in order, the environment variable LONGHORNY_SRC_PASSWORD or LONGHORNY_DST_PASSWORD, the OS keyring (service 'longhorny', MVIP as user name) if the keyring package is installed, and an interactive prompt.
+    Exits rather than waits for input when there is no password and stdin is not a terminal.
+    """
+    password = os.environ.get('LONGHORNY_' + site_name + '_PASSWORD')
+    if password:
+        return password
+    try:
+        import keyring
+        import keyring.errors
+    except ImportError:
+        pass
+    else:
+        try:
+            password = keyring.get_password('longhorny', site['mvip'])
+        except keyring.errors.KeyringError as e:
+            logging.info(
+                "Unable to read %s password from keyring: %s", site_name, e)
+        if password:
+            return password
+    if not sys.stdin.isatty():
+        logging.error("No password for %s cluster in site data, LONGHORNY_%s_PASSWORD or keyring, and no terminal to prompt on. Exiting.",
+                      site_name, site_name)
+        raise LonghornyError(1)
+    from getpass import getpass
+    return getpass("Enter password for " + site_name +
+                   " cluster (not logged): ")
+
+
+@functools.lru_cache(maxsize=128)
 def data_type(s):
     if s == '':
         return []
     try:
-        return [tuple(map(int, item.split(','))) for item in s.split(';')]
-    except BaseException:
+        return [tuple(int_list(item)) for item in s.split(';')]
+    except (ValueError, IndexError, AttributeError):
         logging.error(
             "Pairs must be a semi-colon-separated list of comma-separated items (e.g. '1,51' or '1,51;2,52'). Exiting.")
-        exit(4)
+        raise LonghornyError(4)
 
 
+@functools.lru_cache(maxsize=128)
 def account_data(s):
     try:
-        return [tuple(map(int, item.split(','))) for item in s.split(';')]
-    except BaseException:
+        return [tuple(int_list(item)) for item in s.split(';')]
+    except (ValueError, IndexError, AttributeError):
         logging.error(
             "Account data must be a semi-colon-separated list of comma-separated items (e.g. '1,8;333,444'). Exiting.")
-        exit(4)
+        raise LonghornyError(4)
 
 
+@functools.lru_cache(maxsize=128)
 def account_volume_data(s):
     try:
-        try:
-            s = s.split(';')
-            return tuple(map(int, s[0].split(','))), [int(i)
-                                                      for i in s[1].split(',')]
-        except BaseException:
-            logging.error(
-                "Account IDs from SRC and DST must be semi-colon-separated from list of one or more comma-separated volume IDs (e.g. '1,8;330,331,332'). Exiting.")
-            exit(4)
-    except BaseException:
+        s = s.split(';')
+        return tuple(int_list(s[0])), int_list(s[1])
+    except (ValueError, IndexError, AttributeError):
         logging.error(
-            "Account data must be a semi-colon-separated list of comma-separated items (e.g. '1,8;333,444'). Exiting.")
-        exit(4)
+            "Account IDs from SRC and DST must be semi-colon-separated from list of one or more comma-separated volume IDs (e.g. '1,8;330,331,332'). Exiting.")
+        raise LonghornyError(4)
 
 
+@functools.lru_cache(maxsize=128)
 def access_type(s: str) -> str:
-    if s == 'readwrite' or s == 'readWrite':
-        return 'readWrite'
-    elif s == 'replicationTarget' or s == 'replicationtarget':
-        return 'replicationTarget'
-    else:
+    try:
+        return ACCESS_MODES[s.lower()]
+    except KeyError:
         logging.error(
-            "Volume access property must be one of 'readWrite' or 'replicationTarget', not " +
-            s +
-            ". Exiting.")
-        exit(4)
+            "Volume access property must be one of 'readWrite' or 'replicationTarget', not %s. Exiting.", s)
+        raise LonghornyError(4)
 
 
+@functools.lru_cache(maxsize=128)
 def replication_data(s: str) -> list:
-    data = [None, None]
     s = s.split(';')
-    if s[0].lower() not in ['sync', 'async', 'snapshotsonly']:
+    try:
+        mode = REPLICATION_MODES[s[0].lower()]
+    except KeyError:
         logging.error(
             "Replication mode must be one of 'Sync', 'Async', or 'SnapshotsOnly'. Exiting.")
-        exit(4)
-    else:
-        data[0] = s[0]
-    if s[1] == '':
-        data[1] = []
-        logging.warning(
-            "Will change all volumes to specified replication mode.")
+        raise LonghornyError(4)
     try:
-        data[1] = [int(i) for i in s[1].split(',')]
-    except BaseException:
+        volume_ids = int_list(s[1])
+    except (ValueError, IndexError, AttributeError):
         logging.error(
             "Volume ID(s) must be a one or more integers following the first semicolon after the replication mode string, e.g. --data 'Async;55'. Exiting.")
-        exit(4)
-    if data[0] == 'Sync' or data[0] == 'sync':
+        raise LonghornyError(4)
+    if mode == 'Sync':
         logging.warning("Replication mode set to Sync.")
-        return ['Sync', data[1]]
-    elif data[0] == 'Async' or data[0] == 'async':
-        logging.info("Desired replication is Async.")
-        return ['Async', data[1]]
-    elif data[0] == 'SnapshotsOnly' or data[0] == 'snapshotsonly':
-        logging.info("Desired replication is SnapshotsOnly.")
-        return ['SnapshotsOnly', data[1]]
     else:
-        logging.error(
-            "Replication mode must be one of 'Sync', 'Async', or 'SnapshotsOnly', followed by a comma and one or more SRC volume IDs, e.g. 'Async;55,56'. Exiting.")
-        exit(4)
+        logging.info("Desired replication is %s.", mode)
+    return [mode, volume_ids]
 
 
+@functools.lru_cache(maxsize=128)
 def replication_state(s: str) -> str:
-    if s.lower() not in ['pause', 'paused', 'resume',
-                         'pausedmanual', 'resume', 'resumed']:
+    try:
+        return REPLICATION_STATES[s.lower()]
+    except KeyError:
         logging.error(
             "Replication state 'pausedManual=True' is represented with 'pause' or 'resume'. Use --data 'pause'|'resume'. Exiting.")
-        exit(4)
-    if s == 'pause' or s == 'pausedManual' or s == 'Pause':
-        return 'pause'
-    elif s == 'resume' or s == 'Resume':
-        return 'resume'
-    else:
-        logging.error("Replication mode must be one of 'pause', 'resume'.")
-        exit(4)
+        raise LonghornyError(4)
 
 
+@functools.lru_cache(maxsize=128)
 def snapshot_data(s: str) -> list:
     s = s.split(';')
     try:
         if int(s[0]) < 1 or int(s[0]) > 720:
             logging.error(
                 "Snapshot expiration time must be between 1h and 720h. Exiting.")
-            exit(4)
+            raise LonghornyError(4)
         else:
             return [int(s[0]), s[1]]
-    except BaseException:
+    except (ValueError, IndexError, AttributeError):
         logging.error(
             "Snapshot data must be a semi-colon-separated list of integer and string (e.g. --data '168;my_snapshot'). Exiting.")
-        exit(1)
+        raise LonghornyError(1)
 
 
+@functools.lru_cache(maxsize=128)
 def increase_volume_size_data(s: str) -> list:
     """
     Parses data string like '1073741824;100,200' and returns a list of two elements: added size in bytes and a list SRC/DST volume ID pair.
     """
     s = s.split(';')
     try:
-        #
-        if int(s[0]) < 1073741824 or int(s[0]) > 107374182400:
+        size = int(s[0])
+        if size < GIB or size > 100 * GIB:
             logging.error(
                 "This feature supports volume size growth 1-100 GiB at a time. Exiting.")
-            exit(4)
-        else:
-            s[0] = int(s[0]) - int(s[0]) % 4096
-            return [int(s[0]), [int(i) for i in s[1].split(',')]]
-    except BaseException:
+            raise LonghornyError(4)
+        # round down to a multiple of the 4 KiB block size
+        return [size & ~4095, int_list(s[1])]
+    except (ValueError, IndexError, AttributeError):
         logging.error(
             "Volume size data must be a semi-colon-separated list of integer and comma-separated list of volume IDs (e.g. --data '1073741824;100,200'). Exiting.")
-        exit(4)
+        raise LonghornyError(4)
 
 
+@functools.lru_cache(maxsize=128)
 def upsize_remote_volume_data(s: str) -> list:
     """
     Parses data string like '100,200' and returns a list with two integer elements (SRC and DST volume pair IDs).
     """
-    s = s.split(',')
     try:
-        return [int(s[0]), int(s[1])]
-    except BaseException:
+        src_id, dst_id = int_list(s)
+        return [src_id, dst_id]
+    except (ValueError, IndexError, AttributeError):
         logging.error(
             "Volume ID data must be a comma-separated list of two integers (e.g. --data '100,200'). Exiting.")
-        exit(4)
+        raise LonghornyError(4)
 
 
 def report_data(s):
@@ -1913,209 +1950,290 @@ def report_data(s):
 
 global src, dst
 
-parser = argparse.ArgumentParser()
-
-parser.add_argument(
-    '--dry',
-    type=str,
-    default='off',
-    help='Dry run mode. It is NOT available for all actions, so do not make the assumption that with --dry any action will have zero impact. Enable it with --dry on. Default: off.')
-parser.add_argument(
-    '--tlsv',
-    type=int,
-    default=None,
-    help='Accept only verifiable TLS certificate when working with SolidFire cluster(s) with --tlsv 1. Default: 0.')
-parser.add_argument(
-    '--src',
-    default=os.environ.get(
-        'SRC',
-        ''),
-    help='Source cluster: MVIP, username, password as a dictionary in Bash string representation: --src "{ \'mvip\': \'10.1.1.1\', \'username\':\'admin\', \'password\':\'*\'}".')
-parser.add_argument(
-    '--dst',
-    default=os.environ.get(
-        'DST',
-        ''),
-    help='Destination cluster: MVIP, username, password as a dictionary in Bash string representation: --src "{ \'mvip\': \'10.2.2.2\', \'username\':\'admin\', \'password\':\'*\'}".')
-
-subparsers = parser.add_subparsers()
-
-cluster_parser = subparsers.add_parser('cluster')
-cluster_parser.add_argument_group('cluster')
-cluster_parser.add_argument(
-    '--data',
-    default='',
-    help='Optional data input for selected cluster actions (where indicated in site action help). Not all cluster actions require or accept it.')
-
-cluster_action = cluster_parser.add_mutually_exclusive_group(required=True)
-cluster_action.add_argument(
-    '--list',
-    action='store_true',
-    help='List cluster pairing between SRC and DST clusters. Requires paired SRC and DST clusters. Ignores --data because each cluster params are always available from --src, --dst.')
-cluster_action.add_argument(
-    '--pair',
-    action='store_true',
-    required=False,
-    help='Pair SRC and DST for replication. Requires SRC and DST without existing pairing relationships. Multi-relationships are not supported. Ignores --data.')
-cluster_action.add_argument(
-    '--unpair',
-    action='store_true',
-    required=False,
-    help='Unpair SRC and DST clusters. Requires SRC and DST in exclusive, mutual pairing relationship and no volume pairings. Ignores --data.')
-
-cluster_parser.set_defaults(func=cluster)
-
-volume_parser = subparsers.add_parser('volume')
-volume_parser.add_argument_group('volume')
-volume_parser.add_argument(
-    '--data',
-    default='',
-    help='Optional data input for selected volume actions (where indicated in volume action help). Not all volume actions require or accept it.')
-
-volume_action = volume_parser.add_mutually_exclusive_group(required=True)
-volume_action.add_argument(
-    '--list',
-    action='store_true',
-    help='List volumes correctly paired for replication between SRC and DST cluster. Requires paired SRC and DST clusters. Optional --data argument lists specific volume pair(s).')
-volume_action.add_argument(
-    '--pair',
-    action='store_true',
-    required=False,
-    help='Pair volumes for Async replication between SRC and DST clusters. Takes a semicolon-delimited list of volume IDs from SRC and DST in --data (e.g. --data "111,555;112,600"). Requires paired SRC and DST clusters.')
-volume_action.add_argument(
-    '--unpair',
-    action='store_true',
-    required=False,
-    help='Unpair volumes paired for replication between SRC and DST clusters. Requires paired SRC and DST clusters and at least one volume pairing relationship. Takes --data argument with only one pair at a time. Ex: --data "111,555".')
-volume_action.add_argument(
-    '--prime-dst',
-    action='store_true',
-    required=False,
-    help='Prepare DST cluster for replication by creating volumes from SRC. Creates volumes with identical properties (name, size, etc.) on DST. . Takes one 2-element list of account IDs (SRC account ID,DST account ID) and another of volume IDs on SRC. Ex:  --data "1,22;444,555".')
-volume_action.add_argument(
-    '--mismatched',
-    action='store_true',
-    required=False,
-    help='Check for and report any volumes in asymmetric pair relationships (one-sided and volume size mismatch). Requires paired SRC and DST clusters. Ignores --data.')
-volume_action.add_argument(
-    '--resize',
-    action='store_true',
-    required=False,
-    help='Increase size of paired SRC and DST volumes by up to 1TiB or 2x of the original size, whichever is smaller. readWrite side must be on SRC cluster. Requires --data. Ex: "1073741824;100,200" adds 1 GiB to volume IDs SRC/100, DST/200. Default: "".')
-volume_action.add_argument(
-    '--upsize-remote',
-    action='store_true',
-    required=False,
-    help='Increase size of paired DST volume to the same size of SRC volume, usually to allow DST to catch up with the size of SRC increased by Trident CSI. readWrite side must be on SRC side. Requires --data. Ex: --data "100,200" grows DST/200 to the size of SRC/100. Default: "0,0".')
-volume_action.add_argument(
-    '--reverse',
-    action='store_true',
-    required=False,
-    help='Reverse direction of volume replication. You should stop workloads using current SRC (readWrite) volumes before using this action as SRC side will be flipped to replicationTarget and SRC iSCSI clients disconnected. Ignores --data.')
-volume_action.add_argument(
-    '--snapshot',
-    action='store_true',
-    required=False,
-    help='Take crash-consistent snapshot of all volumes paired for replication at SRC. Use --data to specify non-default retention (1-720) in hours and snapshot name (<16b string). Ex: --data "24;apple". Default: "168;long168h-snap".')
-volume_action.add_argument(
-    '--set-mode',
-    action='store_true',
-    required=False,
-    help='Change replication mode on specific SRC volumes ID(s) in active replication relationship to DST. Mode: Sync, Async, SnapshotsOnly. Example: --data "SnapshotsOnly;101,102,103". Requires existing cluster and volume pairing relationships between SRC and DST. WARNING: SnapshotsOnly replicates nothing if no snapshots are enabled for remote replication (create_snapshot(enable_remote_replication=True)).')
-volume_action.add_argument(
-    '--set-status',
-    action='store_true',
-    required=False,
-    help='Set all SRC relationships to resume or pause state in --data. Ex: --data "pause" sets all SRC volume relationships to manual pause. --data "resume" resumes paused replication at SRC. (WARNING: applies to SRC, not DST).')
-volume_action.add_argument(
-    '--report',
-    action='store_true',
-    required=False,
-    help='TODO: Report volume pairing relationships between SRC and DST, including mismatched and bidirectional. Requires paired SRC and DST clusters. Optional --data arguments: all, SRC, DST (default: all).')
-
-volume_parser.set_defaults(func=volume)
-
-site_parser = subparsers.add_parser('site')
-site_parser.add_argument_group('site')
-site_parser.add_argument(
-    '--data',
-    default='',
-    help='Optional data input for selected site actions (where indicated in site action help). Not all site actions require or accept it.')
-site_action = site_parser.add_mutually_exclusive_group(required=True)
-site_action.add_argument(
-    '--detach-site',
-    action='store_true',
-    help='Remove replication relationships on SRC cluster for the purpose of taking over when DST is unreachable. Requires paired SRC and DST clusters. WARNING: there is no way to re-attach. Disconnected cluster- and volume-relationships need to be removed and re-created.')
-site_action.add_argument(
-    '--set-access',
-    action='store_true',
-    required=False,
-    help='Change access property on all SRC volumes with replication relationship to DST. Options: readWrite, replicationTarget (ex: --data "readWrite"). Requires existing cluster and volume pairing relationships between SRC and DST. WARNING: may stop/interrupt DST->SRC or SRC->DST replication.')
-site_parser.set_defaults(func=site)
-
-args = parser.parse_args()
-
-if args.src is not None or args.dst is not None:
+api_max_retries = 4  # set from --max-retries when run as a script
+sessions = {}
+pairing_cache = {}
+
+# Accepted --data spellings (lower case) and the values SolidFire API expects
+ACCESS_MODES = {'readwrite': 'readWrite',
+                'replicationtarget': 'replicationTarget'}
+REPLICATION_MODES = {'sync': 'Sync', 'async': 'Async',
+                     'snapshotsonly': 'SnapshotsOnly'}
+REPLICATION_STATES = {'pause': 'pause', 'paused': 'pause', 'pausedmanual': 'pause',
+                      'resume': 'resume', 'resumed': 'resume'}
+
+# --data parser of each action that takes --data, by subcommand
+DATA_PARSERS = {'volume': {'list': data_type, 'pair': data_type, 'unpair': data_type,
+                           'prime_dst': account_volume_data, 'snapshot': snapshot_data,
+                           'set_mode': replication_data, 'set_status': replication_state,
+                           'resize': increase_volume_size_data,
+                           'upsize_remote': upsize_remote_volume_data},
+                'site': {'set_access': access_type}}
+
+# --data integer lists, e.g. '1,51' or ' 1, 51 '
+INT_RE = re.compile(r'-?\d+')
+INT_LIST_RE = re.compile(r'\s*-?\d+\s*(?:,\s*-?\d+\s*)*')
+
+RETRYABLE_API_ERRORS = {'xDBConnectionLoss',
+                        'xDBOperationTimeout', 'xNotReadyForIO'}
+RETRYABLE_HTTP_CODES = {429, 502, 503, 504}
+# ApiConnectionError messages that the SDK uses for failures that retrying cannot fix
+PERMANENT_CONNECTION_ERRORS = ('Bad Credentials', '404 Not Found', 'Unknown host',
+                               'cannot be called on a')
+RETRY_BASE_DELAY = 0.5  # seconds
+RETRY_MAX_DELAY = 8.0  # seconds
+
+# Base ListVolumes filters for active, non-VVOL volumes with and without pairing
+PAIRED_VOLUMES = {'isPaired': True, 'volumeStatus': 'active',
+                  'includeVirtualVolumes': False}
+UNPAIRED_VOLUMES = {'isPaired': False, 'volumeStatus': 'active',
+                    'includeVirtualVolumes': False}
+
+GIB = 1 << 30
+TIB = 1 << 40
+MAX_VOLUME_BYTES = 16 * TIB  # SolidFire maximum volume size
+MODIFY_VOLUMES_LIMIT = 500  # maximum number of volumes per ModifyVolumes call
+CLUSTER_NAME_CACHE_TTL = 15  # seconds
+CLUSTER_NAME_CACHE_MAX_AGE = 600  # seconds, when the cluster does not respond
+
+
+def build_parser(argv: list = None) -> argparse.ArgumentParser:
+    """
+    Build the command line parser for argv (default: sys.argv[1:]). Only called when Longhorny runs as a script, so importing it does not construct the parser.
+    """
+    parser = argparse.ArgumentParser()
+    options = []
+
+    options.append(parser.add_argument(
+        '--dry',
+        type=on_off_type,
+        default='off',
+        help='Dry run mode. It is NOT available for all actions, so do not make the assumption that with --dry any action will have zero impact. Enable it with --dry on. Default: off.'))
+    options.append(parser.add_argument(
+        '--tlsv',
+        type=on_off_type,
+        default=False,
+        help='Accept only verifiable TLS certificate when working with SolidFire cluster(s) with --tlsv on (or 1). Default: off.'))
+    options.append(parser.add_argument(
+        '--max-retries',
+        type=non_negative_int,
+        default=4,
+        help='Number of times to retry read-only or idempotent SolidFire API calls that fail with a transient error (connection error, cluster busy, HTTP 429/5xx), using exponential backoff with jitter. Use 0 to disable. Default: 4.'))
+    options.append(parser.add_argument(
+        '--output',
+        type=str,
+        choices=['auto', 'pretty', 'json'],
+        default='auto',
+        help='Format of report output: pretty (Python pretty-print), json, or auto (pretty on a terminal, compact one-line JSON when output is redirected). Default: auto.'))
+    options.append(parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always get cluster names from the clusters. By default a cluster name obtained in the last ' + str(CLUSTER_NAME_CACHE_TTL) + ' seconds is reused from ~/.cache/longhorny, and one up to ' + str(CLUSTER_NAME_CACHE_MAX_AGE) + ' seconds old is used if the cluster does not respond to GetClusterInfo.'))
+    options.append(parser.add_argument(
+        '--src',
+        default=os.environ.get(
+            'SRC',
+            ''),
+        help='Source cluster: MVIP, username, password as semicolon-separated key=value pairs or a dictionary in Bash string representation: --src "mvip=10.1.1.1;username=admin;password=*" or --src "{ \'mvip\': \'10.1.1.1\', \'username\':\'admin\', \'password\':\'*\'}".'))
+    options.append(parser.add_argument(
+        '--dst',
+        default=os.environ.get(
+            'DST',
+            ''),
+        help='Destination cluster: MVIP, username, password as semicolon-separated key=value pairs or a dictionary in Bash string representation: --dst "mvip=10.2.2.2;username=admin;password=*" or --dst "{ \'mvip\': \'10.2.2.2\', \'username\':\'admin\', \'password\':\'*\'}".'))
+
+    subparsers = parser.add_subparsers()
+    commands = {'cluster': add_cluster_parser,
+                'volume': add_volume_parser,
+                'site': add_site_parser}
+    # Only the selected subcommand's parser is needed to parse the command line,
+    # unless there is none or top-level help was asked for before it. The
+    # subcommand is the first argument that is neither an option nor the value
+    # of a global option, so e.g. '--data site' or '--src volume' is not taken
+    # for one. Unknown options and abbreviations fall back to all subparsers.
+    value_options = {o for action in options if action.nargs != 0
+                     for o in action.option_strings}
+    flag_options = {o for action in options if action.nargs == 0
+                    for o in action.option_strings}
+    args_iter = iter(sys.argv[1:] if argv is None else argv)
+    for arg in args_iter:
+        if arg in value_options:
+            next(args_iter, None)
+        elif arg in flag_options or (arg.startswith('--') and '=' in arg):
+            continue
+        elif arg in commands:
+            commands[arg](subparsers)
+            return parser
+        else:
+            break
+    for add_parser in commands.values():
+        add_parser(subparsers)
+    return parser
+
+
+def add_cluster_parser(subparsers):
+    """
+    Add the cluster subcommand and its actions to subparsers.
+    """
+    cluster_parser = subparsers.add_parser('cluster')
+    cluster_parser.add_argument_group('cluster')
+    cluster_parser.add_argument(
+        '--data',
+        default='',
+        help='Optional data input for selected cluster actions (where indicated in site action help). Not all cluster actions require or accept it.')
+
+    cluster_action = cluster_parser.add_mutually_exclusive_group(required=True)
+    cluster_action.add_argument(
+        '--list',
+        action='store_true',
+        help='List cluster pairing between SRC and DST clusters. Requires paired SRC and DST clusters. Ignores --data because each cluster params are always available from --src, --dst.')
+    cluster_action.add_argument(
+        '--pair',
+        action='store_true',
+        required=False,
+        help='Pair SRC and DST for replication. Requires SRC and DST without existing pairing relationships. Multi-relationships are not supported. Ignores --data.')
+    cluster_action.add_argument(
+        '--unpair',
+        action='store_true',
+        required=False,
+        help='Unpair SRC and DST clusters. Requires SRC and DST in exclusive, mutual pairing relationship and no volume pairings. Ignores --data.')
+
+    cluster_parser.set_defaults(func=cluster)
+
+
+def add_volume_parser(subparsers):
+    """
+    Add the volume subcommand and its actions to subparsers.
+    """
+    volume_parser = subparsers.add_parser('volume')
+    volume_parser.add_argument_group('volume')
+    volume_parser.add_argument(
+        '--data',
+        default='',
+        help='Optional data input for selected volume actions (where indicated in volume action help). Not all volume actions require or accept it.')
+
+    volume_action = volume_parser.add_mutually_exclusive_group(required=True)
+    volume_action.add_argument(
+        '--list',
+        action='store_true',
+        help='List volumes correctly paired for replication between SRC and DST cluster. Requires paired SRC and DST clusters. Optional --data argument lists specific volume pair(s).')
+    volume_action.add_argument(
+        '--pair',
+        action='store_true',
+        required=False,
+        help='Pair volumes for Async replication between SRC and DST clusters. Takes a semicolon-delimited list of volume IDs from SRC and DST in --data (e.g. --data "111,555;112,600"). Requires paired SRC and DST clusters.')
+    volume_action.add_argument(
+        '--unpair',
+        action='store_true',
+        required=False,
+        help='Unpair volumes paired for replication between SRC and DST clusters. Requires paired SRC and DST clusters and at least one volume pairing relationship. Takes --data argument with only one pair at a time. Ex: --data "111,555".')
+    volume_action.add_argument(
+        '--prime-dst',
+        action='store_true',
+        required=False,
+        help='Prepare DST cluster for replication by creating volumes from SRC. Creates volumes with identical properties (name, size, etc.) on DST. . Takes one 2-element list of account IDs (SRC account ID,DST account ID) and another of volume IDs on SRC. Ex:  --data "1,22;444,555".')
+    volume_action.add_argument(
+        '--mismatched',
+        action='store_true',
+        required=False,
+        help='Check for and report any volumes in asymmetric pair relationships (one-sided and volume size mismatch). Requires paired SRC and DST clusters. Ignores --data.')
+    volume_action.add_argument(
+        '--resize',
+        action='store_true',
+        required=False,
+        help='Increase size of paired SRC and DST volumes by up to 1TiB or 2x of the original size, whichever is smaller. readWrite side must be on SRC cluster. Requires --data. Ex: "1073741824;100,200" adds 1 GiB to volume IDs SRC/100, DST/200. Default: "".')
+    volume_action.add_argument(
+        '--upsize-remote',
+        action='store_true',
+        required=False,
+        help='Increase size of paired DST volume to the same size of SRC volume, usually to allow DST to catch up with the size of SRC increased by Trident CSI. readWrite side must be on SRC side. Requires --data. Ex: --data "100,200" grows DST/200 to the size of SRC/100. Default: "0,0".')
+    volume_action.add_argument(
+        '--reverse',
+        action='store_true',
+        required=False,
+        help='Reverse direction of volume replication. You should stop workloads using current SRC (readWrite) volumes before using this action as SRC side will be flipped to replicationTarget and SRC iSCSI clients disconnected. Ignores --data.')
+    volume_action.add_argument(
+        '--snapshot',
+        action='store_true',
+        required=False,
+        help='Take crash-consistent group snapshot of all volumes paired for replication at SRC (individual snapshots if group snapshot fails). Use --data to specify non-default retention (1-720) in hours and snapshot name (<16b string). Ex: --data "24;apple". Default: "168;long168h-snap".')
+    volume_action.add_argument(
+        '--set-mode',
+        action='store_true',
+        required=False,
+        help='Change replication mode on specific SRC volumes ID(s) in active replication relationship to DST. Mode: Sync, Async, SnapshotsOnly. Example: --data "SnapshotsOnly;101,102,103". Requires existing cluster and volume pairing relationships between SRC and DST. WARNING: SnapshotsOnly replicates nothing if no snapshots are enabled for remote replication (create_snapshot(enable_remote_replication=True)).')
+    volume_action.add_argument(
+        '--set-status',
+        action='store_true',
+        required=False,
+        help='Set all SRC relationships to resume or pause state in --data. Ex: --data "pause" sets all SRC volume relationships to manual pause. --data "resume" resumes paused replication at SRC. (WARNING: applies to SRC, not DST).')
+    volume_action.add_argument(
+        '--report',
+        action='store_true',
+        required=False,
+        help='TODO: Report volume pairing relationships between SRC and DST, including mismatched and bidirectional. Requires paired SRC and DST clusters. Optional --data arguments: all, SRC, DST (default: all).')
+
+    volume_parser.set_defaults(func=volume)
+
+
+def add_site_parser(subparsers):
+    """
+    Add the site subcommand and its actions to subparsers.
+    """
+    site_parser = subparsers.add_parser('site')
+    site_parser.add_argument_group('site')
+    site_parser.add_argument(
+        '--data',
+        default='',
+        help='Optional data input for selected site actions (where indicated in site action help). Not all site actions require or accept it.')
+    site_action = site_parser.add_mutually_exclusive_group(required=True)
+    site_action.add_argument(
+        '--detach-site',
+        action='store_true',
+        help='Remove replication relationships on SRC cluster for the purpose of taking over when DST is unreachable. Requires paired SRC and DST clusters. WARNING: there is no way to re-attach. Disconnected cluster- and volume-relationships need to be removed and re-created.')
+    site_action.add_argument(
+        '--set-access',
+        action='store_true',
+        required=False,
+        help='Change access property on all SRC volumes with replication relationship to DST. Options: readWrite, replicationTarget (ex: --data "readWrite"). Requires existing cluster and volume pairing relationships between SRC and DST. WARNING: may stop/interrupt DST->SRC or SRC->DST replication.')
+    site_parser.set_defaults(func=site)
+
+
+if __name__ == '__main__':
+    args = build_parser().parse_args()
+
+    # Reject bad --data before prompting for passwords or importing the SDK.
+    # Data parsers are cached, so the action handler gets the parsed value
+    # without parsing it again.
+    if getattr(args, 'data', ''):
+        for action, parse_data in DATA_PARSERS.get(
+                args.func.__name__, {}).items():
+            if getattr(args, action):
+                parse_data(args.data)
+
+    # The SolidFire SDK takes most of the start-up time, so it is imported only
+    # after --help and argument errors have been handled
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection
+    from solidfire.factory import ElementFactory
+    from solidfire import common
+    from solidfire.common import ApiServerError
+    from solidfire.common import SdkOperationError
+    common.setLogLevel(logging.ERROR)
+    SDK_ERRORS = (ApiServerError, common.ApiConnectionError, SdkOperationError)
+    api_max_retries = args.max_retries
+
     try:
-        src = ast.literal_eval(args.src)
-        dst = ast.literal_eval(args.dst)
-    except BaseException:
+        src, dst = [site_data(s) for s in (args.src, args.dst)]
+    except (ValueError, TypeError):
         logging.error(
             "Unable to parse SRC or DST. Review help and try again. Exiting.")
-        exit(1)
-
-if src['password'] == '':
-    src['password'] = getpass("Enter password for SRC cluster (not logged): ")
-if dst['password'] == '':
-    dst['password'] = getpass("Enter password for DST cluster (not logged): ")
-
-if args.tlsv == 1:
-    src['tlsv'] = True
-    dst['tlsv'] = True
-    logging.info("TLS verification is ON.")
-else:
-    src['tlsv'] = False
-    dst['tlsv'] = False
-    logging.info("TLS verification is OFF.")
-try:
-    src['sfe'] = ElementFactory.create(
-        src['mvip'],
-        src['username'],
-        src['password'],
-        verify_ssl=bool(
-            src['tlsv']),
-        print_ascii_art=False)
-    dst['sfe'] = ElementFactory.create(
-        dst['mvip'],
-        dst['username'],
-        dst['password'],
-        verify_ssl=bool(
-            src['tlsv']),
-        print_ascii_art=False)
-except common.SdkOperationError as e:
-    logging.error(e)
-    exit(2)
-except Exception as e:
-    logging.error("Error: " + str(e))
-    exit(2)
-try:
-    src['clusterName'] = src['sfe'].get_cluster_info().to_json()[
-        'clusterInfo']['name']
-    dst['clusterName'] = dst['sfe'].get_cluster_info().to_json()[
-        'clusterInfo']['name']
-    logging.info(
-        "SRC cluster name: " +
-        src['clusterName'] +
-        " and DST cluster name: " +
-        dst['clusterName'] +
-        " obtained.")
-except common.ApiServerError as e:
-    logging.error("Error: " + str(e))
-    exit(3)
-except Exception as e:
-    logging.error(
-        "Error, possibly due to one or both clusters being unreachable: " +
-        str(e))
-    exit(3)
-
-args.func(args)
+        raise LonghornyError(1)
+
+    for site_name, site_conf in (('SRC', src), ('DST', dst)):
+        if site_conf['password'] == '':
+            site_conf['password'] = site_password(site_name, site_conf)
+        site_conf['tlsv'] = args.tlsv
+    logging.info("TLS verification is %s.", 'ON' if args.tlsv else 'OFF')
+    args.func(args)